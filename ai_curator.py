@@ -1,17 +1,228 @@
+import heapq
+import json
+import random
+import threading
+import time
+import numpy as np
 import openai
 import anthropic
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from loguru import logger
 from models import Article
 from config import Config
+from relevance import KeywordMatcher, select_candidates
+from ranking import PreRanker
+from clustering import StoryClusterer
+from novelty import NoveltyIndex
+from relevance_model import RelevanceModel, ScoreHistory
+from prompt_budget import TokenBudget
+from llm_engine import AsyncLLMEngine, CircuitBreaker, CircuitOpenError
+from llm_router import ChatResult, ProviderRouter
+from content_cache import LLMResponseCache
+
+# Title keywords that raise the fallback importance score ('*' marks a prefix)
+FALLBACK_TITLE_MATCHER = KeywordMatcher({
+    # High importance keywords
+    'high': ['breakthrough*', 'launch*', 'announce*', 'release*', 'new', 'first', 'major', 'billion*', 'funding'],
+    # AI/tech specific keywords
+    'ai': ['openai', 'anthropic', 'google ai', 'meta ai', 'chatgpt', 'gpt-4*', 'claude', 'ai model*']
+})
+# Source credibility
+PREMIUM_SOURCE_MATCHER = KeywordMatcher({
+    'premium': ['techcrunch', 'wired', 'venturebeat', 'ai news', 'google', 'openai', 'anthropic']
+})
 
 class AIContentCurator:
     """Uses AI to curate and summarize content"""
     
+    # Bump a template's version whenever its prompt changes so cached responses aren't reused
+    PROMPT_VERSIONS = {
+        'importance': 1,
+        'importance_batch': 1,
+        'summary': 1,
+        'score_summary': 1,
+        'intro': 1
+    }
+    
     def __init__(self):
         self.config = Config()
-        self.openai_client = openai.OpenAI(api_key=self.config.OPENAI_API_KEY)
+        self.openai_client = openai.OpenAI(
+            api_key=self.config.OPENAI_API_KEY,
+            base_url=self.config.OPENAI_BASE_URL,
+            timeout=self.config.LLM_TIMEOUT
+        )
         self.anthropic_client = anthropic.Anthropic(api_key=self.config.ANTHROPIC_API_KEY) if self.config.ANTHROPIC_API_KEY else None
+        self.budget = TokenBudget(self.config.OPENAI_MODEL)
+        self.llm_engine = AsyncLLMEngine(self.config, self.budget) if self.config.ASYNC_CURATION else None
+        self.router = ProviderRouter(self.config, self.llm_engine) if self.config.LLM_ROUTING != "openai" else None
+        self.llm_cache = LLMResponseCache(
+            self.config.CONTENT_CACHE_DB,
+            ttl_hours=self.config.LLM_CACHE_TTL_HOURS,
+            max_bytes=self.config.LLM_CACHE_MAX_MB * 1024 * 1024
+        ) if self.config.LLM_CACHE_ENABLED else None
+        self.breaker = CircuitBreaker(self.config.LLM_BREAKER_THRESHOLD, self.config.LLM_BREAKER_COOLDOWN)
+        self.prerank = PreRanker(self.config) if self.config.PRERANK_ENABLED else None
+        self.clusterer = StoryClusterer(self.config) if self.config.CLUSTERING_ENABLED else None
+        self.novelty = NoveltyIndex(self.config) if self.config.NOVELTY_ENABLED else None
+        # LLM scores are always kept, so there is history to train the relevance model on
+        self.score_history = ScoreHistory(self.config.CONTENT_CACHE_DB)
+        self.relevance_model = RelevanceModel.load(self.config.RELEVANCE_MODEL_PATH, self.config) if self.config.RELEVANCE_MODEL_ENABLED else None
+        self.llm_calls: List[dict] = []
+        self.llm_scores: List[Tuple[Article, float]] = []
+        self.local_decisions: List[str] = []
+        self.audited_urls: Set[str] = set()
+        self._llm_run_open = False
+        # Whether this thread's last _chat was served from the response cache
+        self._last_chat = threading.local()
+    
+    def _chat(self, prompt: str, template: str, max_tokens: int, temperature: float, **kwargs) -> str:
+        """Send a single-message chat completion, served from the response cache when possible"""
+        request = dict(
+            model=self.config.OPENAI_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+        self._last_chat.cached = False
+        
+        if self.llm_cache:
+            cache_template = f"{template}:v{self.PROMPT_VERSIONS[template]}"
+            cache_key = self.llm_cache.key(request['model'], cache_template, request)
+            cached = self.llm_cache.get(cache_key)
+            if cached is not None:
+                self._last_chat.cached = True
+                return cached
+        
+        # Fails fast while the breaker is open, so callers fall back without waiting on timeouts
+        self.breaker.before_call()
+        
+        started = time.monotonic()
+        try:
+            if self.router:
+                result = self.router.chat_sync(**request)
+            elif self.llm_engine:
+                result = ChatResult.from_openai(self.llm_engine.chat_sync(**request))
+            else:
+                result = ChatResult.from_openai(self.openai_client.chat.completions.create(**request))
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        
+        seconds = time.monotonic() - started
+        
+        content = result.content
+        # Servers that omit usage are counted locally
+        prompt_tokens = result.prompt_tokens if result.prompt_tokens is not None else self.budget.count(prompt)
+        completion_tokens = result.completion_tokens if result.completion_tokens is not None else self.budget.count(content or "")
+        input_cost, output_cost = (
+            (self.config.ANTHROPIC_INPUT_COST_PER_1K, self.config.ANTHROPIC_OUTPUT_COST_PER_1K)
+            if result.provider == "anthropic" else
+            (self.config.LLM_INPUT_COST_PER_1K, self.config.LLM_OUTPUT_COST_PER_1K)
+        )
+        self.llm_calls.append({
+            'model': result.model or request['model'],
+            'provider': result.provider,
+            'template': template,
+            'seconds': seconds,
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': completion_tokens,
+            'cost': (prompt_tokens * input_cost + completion_tokens * output_cost) / 1000
+        })
+        
+        if self.llm_cache and content:
+            self.llm_cache.put(cache_key, request['model'], cache_template, content, prompt_tokens + completion_tokens)
+        return content
+    
+    def _record_score(self, article: Article, score: float):
+        """Keep an LLM score for the training history, unless it was replayed from the response cache"""
+        if not getattr(self._last_chat, 'cached', False):
+            self.llm_scores.append((article, score))
+    
+    def start_llm_run(self):
+        """Reset per-run LLM call and cache statistics
+        
+        Curation inside an open run joins it instead of starting its own, so a caller
+        can also count the calls made after curation, like the newsletter intro.
+        """
+        self._llm_run_open = True
+        self.llm_calls = []
+        self.llm_scores = []
+        self.local_decisions = []
+        self.audited_urls = set()
+        self.breaker.reset()
+        if self.router:
+            self.router.reset_stats()
+        if self.llm_cache:
+            self.llm_cache.reset_stats()
+    
+    def finish_llm_run(self):
+        """Save this run's LLM scores to the training history and log its LLM usage"""
+        self._llm_run_open = False
+        self.score_history.record(self.llm_scores, self.audited_urls)
+        self._log_llm_usage()
+    
+    def _log_llm_usage(self):
+        """Log how many LLM calls this run made, with their tokens and time, and the cache hit rate"""
+        if self.llm_cache:
+            evicted = self.llm_cache.evict()
+            lookups = self.llm_cache.hits + self.llm_cache.misses
+            hit_rate = self.llm_cache.hits / lookups if lookups else 0.0
+            logger.info(
+                f"LLM cache: {self.llm_cache.hits} hits, {self.llm_cache.misses} misses ({hit_rate:.0%}), "
+                f"{self.llm_cache.saved_tokens} tokens saved, {evicted} evicted"
+            )
+        
+        if self.breaker.times_opened:
+            logger.warning(
+                f"LLM circuit breaker: opened {self.breaker.times_opened} times, "
+                f"{self.breaker.short_circuited} calls skipped, now {self.breaker.state}"
+            )
+        
+        if self.router and self.router.policy == "hedged":
+            logger.info(
+                f"LLM routing: {self.router.hedges} hedged requests, "
+                f"wins {', '.join(f'{provider} {wins}' for provider, wins in self.router.wins.items())}, "
+                f"hedge delay now {self.router.hedge_delay():.2f}s"
+            )
+        
+        if self.relevance_model and self.local_decisions:
+            minor = self.local_decisions.count('minor')
+            important = self.local_decisions.count('important')
+            # A scoring request covers a whole batch; in combined mode it also carries the summary
+            score_calls = 1 / max(1, self.config.SCORING_BATCH_SIZE)
+            if self.config.CURATION_MODE == "combined":
+                saved = minor
+            else:
+                saved = minor * (1 + score_calls) + important * score_calls
+            logger.info(
+                f"Local relevance model: {minor} minor and {important} important articles scored locally, "
+                f"{self.local_decisions.count('uncertain')} left to the LLM and {self.local_decisions.count('audit')} "
+                f"audited by it, ~{saved:.0f} LLM calls saved"
+            )
+        
+        if not self.llm_calls:
+            return
+        
+        latencies = np.array([call['seconds'] for call in self.llm_calls])
+        p50, p95 = np.percentile(latencies, [50, 95])
+        prompt_tokens = sum(call['prompt_tokens'] for call in self.llm_calls)
+        completion_tokens = sum(call['completion_tokens'] for call in self.llm_calls)
+        cost = sum(call['cost'] for call in self.llm_calls)
+        logger.info(
+            f"LLM usage: {len(self.llm_calls)} calls, {prompt_tokens} prompt + {completion_tokens} completion tokens, "
+            f"${cost:.4f}, latency p50 {p50:.2f}s / p95 {p95:.2f}s, {latencies.sum():.1f}s total"
+        )
+        
+        by_template = {}
+        for call in self.llm_calls:
+            calls, tokens = by_template.get(call['template'], (0, 0))
+            by_template[call['template']] = (calls + 1, tokens + call['prompt_tokens'] + call['completion_tokens'])
+        logger.info("LLM usage by prompt: " + ", ".join(
+            f"{template} {calls} calls / {tokens} tokens" for template, (calls, tokens) in by_template.items()
+        ))
     
     def score_article_importance(self, article: Article) -> float:
         """Score article importance using AI"""
@@ -25,7 +236,7 @@ class AIContentCurator:
             
             Article Title: {article.title}
             Source: {article.source}
-            Summary: {article.summary[:500]}...
+            Summary: {self.budget.truncate(article.summary, self.config.SCORE_SUMMARY_TOKENS)}...
             
             Consider factors like:
             - Innovation level
@@ -35,20 +246,88 @@ class AIContentCurator:
               Respond with only a number between 1-10.
             """
             
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=10,
-                temperature=0.3
-            )
+            response_text = self._chat(prompt, "importance", max_tokens=10, temperature=0.3)
             
-            score = float(response.choices[0].message.content.strip())
-            return max(1, min(10, score))  # Ensure score is between 1-10
+            score = max(1, min(10, float(response_text.strip())))  # Ensure score is between 1-10
+            self._record_score(article, score)
+            return score
             
+        except CircuitOpenError:
+            return self._fallback_importance_score(article)  # The LLM is failing; don't log every skipped call
         except Exception as e:
             logger.error(f"Error scoring article importance: {e}")
             return 5.0  # Default moderate score
     
+    def score_articles_batch(self, articles: List[Article]) -> List[float]:
+        """Score several articles in one request, falling back per article for missing or invalid items"""
+        if not articles:
+            return []
+        
+        scores = {}
+        try:
+            article_list = "\n\n".join(
+                f"ID {index}\nTitle: {article.title}\nSource: {article.source}\nSummary: {self.budget.truncate(article.summary, self.config.SCORE_SUMMARY_TOKENS)}..."
+                for index, article in enumerate(articles)
+            )
+            
+            prompt = f"""
+            Rate the importance of each of these AI/tech articles on a scale of 1-10, where:
+            1-3: Minor news, incremental updates
+            4-6: Moderate importance, interesting developments
+            7-8: Significant news, major breakthroughs
+            9-10: Groundbreaking, industry-changing news
+            
+            Consider factors like:
+            - Innovation level
+            - Impact on industry
+            - Credibility of source
+            - Uniqueness of information
+            
+            {article_list}
+            
+            Respond with only JSON in this shape, one entry per article ID:
+            {{"scores": [{{"id": 0, "score": 7}}, {{"id": 1, "score": 4}}]}}
+            """
+            
+            response_text = self._chat(
+                prompt,
+                "importance_batch",
+                max_tokens=20 * len(articles) + 20,
+                temperature=0.3,
+                response_format={"type": "json_object"}
+            )
+            scores = self._parse_batch_scores(response_text, len(articles))
+            
+        except Exception as e:
+            logger.error(f"Error batch scoring {len(articles)} articles: {e}")
+        
+        results = []
+        for index, article in enumerate(articles):
+            if index in scores:
+                results.append(scores[index])
+                self._record_score(article, scores[index])
+            else:
+                logger.warning(f"No valid batch score for: {article.title}; using fallback score")
+                results.append(self._fallback_importance_score(article))
+        
+        return results
+    
+    def _parse_batch_scores(self, response_text: str, count: int) -> Dict[int, float]:
+        """Validate a batch scoring response item by item, keeping only well-formed scores"""
+        items = json.loads(response_text).get("scores", [])
+        
+        scores = {}
+        for item in items if isinstance(items, list) else []:
+            try:
+                index = int(item["id"])
+                score = float(item["score"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= index < count and index not in scores:
+                scores[index] = max(1, min(10, score))  # Ensure score is between 1-10
+        
+        return scores
+    
     def generate_ai_summary(self, article: Article) -> str:
         """Generate AI summary of article"""
         try:
@@ -64,72 +343,235 @@ class AIContentCurator:
             - Why it matters (impact)
             
             Article Title: {article.title}
-            Content: {content_to_summarize[:2000]}...
+            Content: {self.budget.truncate(content_to_summarize, self.config.SUMMARY_CONTENT_TOKENS)}...
             
             Write 1-2 sentences max:
             """
             
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=100,
-                temperature=0.5
-            )
-            
-            return response.choices[0].message.content.strip()
+            return self._chat(prompt, "summary", max_tokens=100, temperature=0.5).strip()
             
+        except CircuitOpenError:
+            return self._fallback_summary(article)  # The LLM is failing; don't log every skipped call
         except Exception as e:
             logger.error(f"Error generating AI summary: {e}")
             return article.summary[:200] + "..."
     
+    def score_and_summarize(self, article: Article) -> Tuple[float, str]:
+        """Score and summarize an article from one structured response"""
+        content_to_summarize = article.content or article.summary
+        
+        prompt = f"""
+        Rate the importance of this AI/tech article on a scale of 1-10, where:
+        1-3: Minor news, incremental updates
+        4-6: Moderate importance, interesting developments
+        7-8: Significant news, major breakthroughs
+        9-10: Groundbreaking, industry-changing news
+        
+        Consider innovation level, impact on industry, credibility of source and uniqueness of information.
+        
+        Then summarize it in 1-2 sentences maximum, concise and punchy like Superhuman newsletter style,
+        covering the key development (what happened) and why it matters (impact).
+        
+        Article Title: {article.title}
+        Source: {article.source}
+        Content: {self.budget.truncate(content_to_summarize, self.config.SUMMARY_CONTENT_TOKENS)}...
+        
+        Respond with only JSON in this shape:
+        {{"score": 7, "summary": "..."}}
+        """
+        
+        try:
+            response = json.loads(self._chat(
+                prompt,
+                "score_summary",
+                max_tokens=120,
+                temperature=0.4,
+                response_format={"type": "json_object"}
+            ))
+        except CircuitOpenError:
+            # The LLM is failing; don't log every skipped call
+            return self._fallback_importance_score(article), self._fallback_summary(article)
+        except Exception as e:
+            logger.error(f"Error scoring and summarizing article: {e}")
+            response = {}
+        if not isinstance(response, dict):
+            response = {}  # Valid JSON, but not the object asked for
+        
+        try:
+            score = max(1, min(10, float(response["score"])))  # Ensure score is between 1-10
+            self._record_score(article, score)
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"No valid score for: {article.title}; using fallback score")
+            score = self._fallback_importance_score(article)
+        
+        summary = response.get("summary")
+        if len(content_to_summarize) < 100:
+            summary = content_to_summarize  # Too short to be worth rewriting
+        elif not isinstance(summary, str) or not summary.strip():
+            logger.warning(f"No valid summary for: {article.title}; using fallback summary")
+            summary = self._fallback_summary(article)
+        
+        return score, summary.strip()
+    
     def curate_articles(self, articles: List[Article]) -> List[Article]:
         """Curate and enhance articles with AI"""
         logger.info("Starting AI curation process...")
+        owns_run = not self._llm_run_open
+        if owns_run:
+            self.start_llm_run()
         
         curated_articles = []
         
-        # Filter to AI/tech relevant articles first by keywords in title
-        ai_keywords = ['ai', 'artificial intelligence', 'machine learning', 'neural', 'deep learning', 
-                      'chatgpt', 'gpt', 'llm', 'openai', 'anthropic', 'google', 'meta', 'tech',
-                      'startup', 'algorithm', 'automation', 'robot', 'quantum', 'cloud', 'data']
+        clusters = []
+        if self.clusterer:
+            # Near-duplicate coverage of one story is curated once, through its representative
+            clusters = self.clusterer.cluster(articles)
+            articles = [cluster.representative for cluster in clusters]
+        
+        if self.novelty:
+            # Stories featured in a past edition never reach scoring again
+            articles = self.novelty.filter_new(articles)
+        
+        if self.prerank:
+            # Rank everything locally and send only the top K to the LLM
+            relevant_articles = self.prerank.shortlist(articles, self.config.PRERANK_TOP_K)
+        else:
+            # Keyword relevance filter, topped up with general articles (max 15)
+            relevant_articles = select_candidates(articles)
+        
+        curated_articles.extend(self._curate_batches(self._batches(relevant_articles)))
+        
+        for cluster in clusters:
+            if cluster.representative.importance_score is not None:
+                cluster.share_curation()
+        
+        if owns_run:
+            self.finish_llm_run()
+        return self._select_top_articles(curated_articles)
+    
+    def curate_stream(self, articles: Iterable[Article]) -> List[Article]:
+        """Curate articles as they arrive from a streaming collector"""
+        logger.info("Starting streaming AI curation process...")
+        owns_run = not self._llm_run_open
+        if owns_run:
+            self.start_llm_run()
         
-        relevant_articles = []
+        if self.novelty:
+            articles = (article for article in articles if self.novelty.match(article) is None)
+        
+        # Candidates are already filtered upstream, so scoring starts on the first batch
+        curated_articles = self._curate_batches(self._batches(articles))
+        
+        if owns_run:
+            self.finish_llm_run()
+        return self._select_top_articles(curated_articles)
+    
+    def record_featured(self, articles: List[Article]):
+        """Remember the stories of an edition that was sent so later editions skip them"""
+        if self.novelty:
+            self.novelty.record(articles)
+    
+    def _batches(self, articles: Iterable[Article]) -> Iterator[List[Article]]:
+        """Group articles into scoring batches of SCORING_BATCH_SIZE"""
+        batch_size = max(1, self.config.SCORING_BATCH_SIZE)
+        batch = []
         for article in articles:
-            title_lower = article.title.lower()
-            if any(keyword in title_lower for keyword in ai_keywords):
-                relevant_articles.append(article)
-        
-        # If we don't have enough relevant articles, include some general tech articles
-        if len(relevant_articles) < 10:
-            for article in articles:
-                if article not in relevant_articles:
-                    relevant_articles.append(article)
-                if len(relevant_articles) >= 15:  # Limit to top 15 for processing
-                    break
-        
-        for article in relevant_articles:
-            try:
-                # Score importance
-                article.importance_score = self.score_article_importance(article)
+            batch.append(article)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    
+    def _curate_batches(self, batches: Iterable[List[Article]]) -> List[Article]:
+        """Curate batches one after another, or concurrently through the async LLM engine"""
+        if not self.llm_engine:
+            return [article for batch in batches for article in self._curate_batch(batch)]
+        
+        # Workers only wait on the engine, which applies the concurrency and rate limits
+        with ThreadPoolExecutor(max_workers=max(1, self.config.LLM_CONCURRENCY), thread_name_prefix="curate") as executor:
+            futures = [executor.submit(self._curate_batch, batch) for batch in batches]
+            return [article for future in futures for article in future.result()]
+    
+    def _curate_batch(self, articles: List[Article]) -> List[Article]:
+        """Curate a batch, scoring it in one request when batching is enabled"""
+        curated = []
+        if self.relevance_model:
+            # Clear cases are scored locally; only the uncertain middle band is scored by the LLM
+            curated, articles = self._curate_clear_cases(articles)
+            if not articles:
+                return curated
+        
+        # Combined mode already scores each article in its summary request
+        if len(articles) == 1 or self.config.CURATION_MODE == "combined":
+            return curated + [self._curate_article(article) for article in articles]
+        
+        scores = self.score_articles_batch(articles)
+        return curated + [self._curate_article(article, score) for article, score in zip(articles, scores)]
+    
+    def _curate_clear_cases(self, articles: List[Article]) -> Tuple[List[Article], List[Article]]:
+        """Curate the articles the relevance model is confident about, returning them and the rest"""
+        curated, uncertain = [], []
+        for article, decision in zip(articles, self.relevance_model.classify(articles)):
+            if decision == 'important' and self.config.CURATION_MODE == "combined":
+                # Its summary request returns a score anyway, which serves as an audit for free
+                self.audited_urls.add(article.url)
+                decision = 'uncertain'
+            elif decision != 'uncertain' and random.random() < self.config.RELEVANCE_MODEL_AUDIT_RATE:
+                # A sample of clear cases is still scored by the LLM, to check the model against
+                self.audited_urls.add(article.url)
+                decision = 'audit'
+            self.local_decisions.append(decision)
+            
+            if decision == 'minor':
+                # Won't make the digest, so it isn't worth any LLM calls
+                article.importance_score = self.relevance_model.low_score
+                article.ai_summary = self._fallback_summary(article)
+                curated.append(article)
+            elif decision == 'important':
+                # Only the summary still needs the LLM
+                curated.append(self._curate_article(article, self.relevance_model.high_score))
+            else:
+                uncertain.append(article)
+        
+        return curated, uncertain
+    
+    def _curate_article(self, article: Article, score: Optional[float] = None) -> Article:
+        """Score and summarize a single article, falling back to heuristics on failure"""
+        if not self.breaker.allows_call():
+            # The LLM is failing; use the heuristics without waiting on it
+            article.importance_score = self._fallback_importance_score(article)
+            article.ai_summary = self._fallback_summary(article)
+            return article
+        
+        try:
+            if score is None and self.config.CURATION_MODE == "combined":
+                # One request returns both the score and the summary
+                article.importance_score, article.ai_summary = self.score_and_summarize(article)
+            else:
+                # Score importance, unless a batch request already did
+                article.importance_score = score if score is not None else self.score_article_importance(article)
                 
                 # Generate AI summary
                 article.ai_summary = self.generate_ai_summary(article)
-                
-                curated_articles.append(article)
-                logger.info(f"Curated article: {article.title} (Score: {article.importance_score})")                
-            except Exception as e:
-                logger.error(f"Error curating article {article.title}: {e}")
-                # Still include the article with original summary and smart importance scoring
-                article.importance_score = self._fallback_importance_score(article)
-                article.ai_summary = self._fallback_summary(article)
-                curated_articles.append(article)
+            
+            logger.info(f"Curated article: {article.title} (Score: {article.importance_score})")
+        except Exception as e:
+            logger.error(f"Error curating article {article.title}: {e}")
+            # Still include the article with original summary and smart importance scoring
+            article.importance_score = self._fallback_importance_score(article)
+            article.ai_summary = self._fallback_summary(article)
         
-        # Sort by importance score (highest first)
-        curated_articles.sort(key=lambda x: x.importance_score, reverse=True)
+        return article
+    
+    def _select_top_articles(self, curated_articles: List[Article]) -> List[Article]:
+        """Pick exactly 5 articles for the daily digest"""
+        # Best 5 by importance score (highest first, ties in curation order) without sorting everything
+        curated_articles = heapq.nlargest(5, curated_articles, key=lambda x: x.importance_score)
         
         # Always ensure we have exactly 5 articles for daily digest
         if len(curated_articles) >= 5:
-            top_articles = curated_articles[:5]
+            top_articles = curated_articles
         else:
             # If we have fewer than 5, duplicate the best ones to reach 5
             logger.warning(f"Only found {len(curated_articles)} articles. Duplicating best ones to reach 5.")
@@ -161,30 +603,16 @@ class AIContentCurator:
         """Generate importance score based on keywords and source when AI fails"""
         score = 5.0  # Base score
         
-        title_lower = article.title.lower()
-        source_lower = article.source.lower()
-        
-        # High importance keywords
-        high_keywords = ['breakthrough', 'launches', 'announces', 'release', 'new', 'first', 'major', 'billion', 'funding']
-        # AI/tech specific keywords  
-        ai_keywords = ['openai', 'anthropic', 'google ai', 'meta ai', 'chatgpt', 'gpt-4', 'claude', 'ai model']
-        # Source credibility
-        premium_sources = ['techcrunch', 'wired', 'venturebeat', 'ai news', 'google', 'openai', 'anthropic']
+        title_matches = FALLBACK_TITLE_MATCHER.matches(article.title)
         
         # Boost score for high-impact keywords
-        for keyword in high_keywords:
-            if keyword in title_lower:
-                score += 1.0
+        score += 1.0 * len(title_matches.get('high', ()))
         
         # Boost score for AI-specific content
-        for keyword in ai_keywords:
-            if keyword in title_lower:
-                score += 1.5
+        score += 1.5 * len(title_matches.get('ai', ()))
         
         # Boost score for premium sources
-        for source in premium_sources:
-            if source in source_lower:
-                score += 0.5
+        score += 0.5 * len(PREMIUM_SOURCE_MATCHER.matches(article.source).get('premium', ()))
         
         return min(10.0, score)  # Cap at 10
     
@@ -223,14 +651,7 @@ class AIContentCurator:
             
             Write 1 sentence:            """
             
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=50,
-                temperature=0.7
-            )
-            
-            intro = response.choices[0].message.content.strip()
+            intro = self._chat(prompt, "intro", max_tokens=50, temperature=0.7).strip()
             
             # Ensure the intro mentions "today" or "today's"
             if "today" not in intro.lower():
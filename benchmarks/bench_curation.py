@@ -0,0 +1,60 @@
+"""
+Benchmark serial curation against the async LLM engine using the local fake OpenAI server.
+No API key or network access is needed.
+
+Usage:
+  python benchmarks/bench_curation.py                  # 15 candidates, 0.5s latency, no server limit
+  python benchmarks/bench_curation.py 15 0.5 5         # candidates / latency / server requests per second
+"""
+
+import os
+import sys
+import time
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_scoring import build_candidates
+from fake_openai_server import FakeOpenAIServer
+from ai_curator import AIContentCurator
+from config import Config
+
+
+def run(label: str, server: FakeOpenAIServer, count: int, async_curation: bool):
+    """Curate `count` candidates and print wall time, calls and 429s"""
+    Config.ASYNC_CURATION = async_curation
+    curator = AIContentCurator()
+    candidates = build_candidates(count)
+    server.requests = server.rejected = 0
+
+    started = time.perf_counter()
+    curator.curate_stream(candidates)
+    seconds = time.perf_counter() - started
+
+    if curator.llm_engine:
+        curator.llm_engine.close()
+    print(f"{label:<10}{len(curator.llm_calls):>7}{server.requests:>10}{server.rejected:>6}{seconds:>10.2f}")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    rate_limit = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    server = FakeOpenAIServer(latency=latency, rate_limit=rate_limit).start()
+    Config.OPENAI_BASE_URL = server.base_url
+    Config.OPENAI_API_KEY = Config.OPENAI_API_KEY or "fake"
+    Config.LLM_CACHE_ENABLED = False  # Every pass must reach the server
+
+    print(f"{count} candidates, {latency}s latency, server limit {rate_limit or 'none'}/s, "
+          f"concurrency {Config.LLM_CONCURRENCY}, {Config.LLM_REQUESTS_PER_MINUTE} RPM, "
+          f"{Config.LLM_TOKENS_PER_MINUTE} TPM\n")
+    print(f"{'mode':<10}{'calls':>7}{'requests':>10}{'429s':>6}{'seconds':>10}")
+
+    run('serial', server, count, async_curation=False)
+    run('async', server, count, async_curation=True)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
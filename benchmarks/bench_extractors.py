@@ -0,0 +1,97 @@
+"""
+Benchmark content extractors on saved HTML fixtures.
+Reports extraction time and word-level precision/recall/F1 against each fixture's expected text.
+
+Usage:
+  python benchmarks/bench_extractors.py            # 20 repeats per fixture
+  python benchmarks/bench_extractors.py 100        # custom repeat count
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from extractors import FallbackExtractor, LxmlExtractor, NewspaperExtractor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixtures():
+    """Load (name, html, expected_text) for every fixture page"""
+    fixtures = []
+    for html_path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))):
+        name = os.path.splitext(os.path.basename(html_path))[0]
+        with open(html_path, encoding='utf-8') as f:
+            html = f.read()
+        with open(html_path[:-len('.html')] + '.txt', encoding='utf-8') as f:
+            expected = f.read()
+        fixtures.append((name, html, expected))
+    return fixtures
+
+
+def word_scores(extracted: str, expected: str, limit: int):
+    """Word-level precision/recall/F1
+
+    Precision is measured against the whole expected text, recall against its first
+    `limit` characters, since curation never reads further than that.
+    """
+    def words(text):
+        return Counter(re.findall(r"\w+", text.lower()))
+
+    got = words(extracted)
+    precision = sum((got & words(expected)).values()) / max(1, sum(got.values()))
+    want = words(expected[:limit])
+    recall = sum((got & want).values()) / max(1, sum(want.values()))
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    config = Config()
+    fixtures = load_fixtures()
+
+    # Import newspaper3k up front so its import cost doesn't land in the first timing
+    started = time.perf_counter()
+    import newspaper  # noqa: F401
+    print(f"newspaper3k import: {(time.perf_counter() - started) * 1000:.0f} ms\n")
+
+    extractors = [
+        LxmlExtractor(target_chars=config.EXTRACT_TARGET_CHARS),
+        NewspaperExtractor(),
+        FallbackExtractor(
+            LxmlExtractor(target_chars=config.EXTRACT_TARGET_CHARS),
+            NewspaperExtractor(),
+            min_chars=config.EXTRACT_MIN_CHARS
+        ),
+    ]
+
+    print(f"{'fixture':<16}{'extractor':<18}{'ms/page':>10}{'chars':>8}{'prec':>7}{'recall':>8}{'f1':>6}")
+    totals = {extractor.name: 0.0 for extractor in extractors}
+
+    for name, html, expected in fixtures:
+        for extractor in extractors:
+            started = time.perf_counter()
+            for _ in range(repeats):
+                text = extractor.extract(html, f"https://example.com/{name}")
+            elapsed_ms = (time.perf_counter() - started) * 1000 / repeats
+            totals[extractor.name] += elapsed_ms
+
+            precision, recall, f1 = word_scores(text, expected, config.EXTRACT_TARGET_CHARS)
+            print(f"{name:<16}{extractor.name:<18}{elapsed_ms:>10.2f}{len(text):>8}"
+                  f"{precision:>7.2f}{recall:>8.2f}{f1:>6.2f}")
+
+    print()
+    for extractor_name, total_ms in totals.items():
+        print(f"{extractor_name:<18} total {total_ms:.2f} ms per pass over {len(fixtures)} fixtures")
+
+
+if __name__ == "__main__":
+    main()
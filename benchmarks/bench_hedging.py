@@ -0,0 +1,75 @@
+"""
+Benchmark hedged provider routing against OpenAI-only routing with two local fake endpoints.
+The fake OpenAI endpoint has a slow tail; the fake Anthropic endpoint is steady.
+No API keys or network access are needed.
+
+Usage:
+  python benchmarks/bench_hedging.py                    # 60 scoring calls, 10% of them 2s slow
+  python benchmarks/bench_hedging.py 100 0.2 3.0        # calls / slow fraction / slow latency
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_scoring import build_candidates
+from fake_openai_server import FakeOpenAIServer
+from ai_curator import AIContentCurator
+from config import Config
+
+
+def run(label: str, routing: str, calls: int):
+    """Score `calls` articles one at a time, print the latency distribution and return the router"""
+    Config.LLM_ROUTING = routing
+    curator = AIContentCurator()
+    latencies = []
+
+    for article in build_candidates(calls):
+        started = time.perf_counter()
+        curator.score_article_importance(article)
+        latencies.append(time.perf_counter() - started)
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    router = curator.router
+    hedges = router.hedges if router else 0
+    anthropic_wins = router.wins['anthropic'] if router else 0
+    print(f"{label:<10}{p50:>8.2f}{p95:>8.2f}{p99:>8.2f}{max(latencies):>8.2f}{sum(latencies):>9.1f}"
+          f"{hedges:>8}{anthropic_wins:>10}")
+    return router
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    slow_fraction = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    slow_latency = float(sys.argv[3]) if len(sys.argv) > 3 else 2.0
+
+    openai_server = FakeOpenAIServer(latency=0.1, slow_fraction=slow_fraction, slow_latency=slow_latency).start()
+    anthropic_server = FakeOpenAIServer(latency=0.15).start()
+
+    Config.OPENAI_BASE_URL = openai_server.base_url
+    Config.OPENAI_API_KEY = "fake"
+    Config.ANTHROPIC_BASE_URL = anthropic_server.anthropic_base_url
+    Config.ANTHROPIC_API_KEY = "fake"
+    Config.LLM_CACHE_ENABLED = False  # Every call must reach a server
+    Config.LLM_HEDGE_DELAY = 0.3
+    Config.LLM_HEDGE_MIN_SAMPLES = 10
+
+    print(f"{calls} calls, OpenAI 0.10s with {slow_fraction:.0%} at {slow_latency}s, Anthropic 0.15s, "
+          f"hedge at p{Config.LLM_HEDGE_PERCENTILE:.0f}\n")
+    print(f"{'routing':<10}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}{'total':>9}{'hedges':>8}{'anthropic':>10}")
+
+    run('openai', 'openai', calls)
+    router = run('hedged', 'hedged', calls)
+    assert not router.hedges or router.wins['anthropic'], "hedges were sent but Anthropic never answered first"
+
+    openai_server.shutdown()
+    anthropic_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Microbenchmark the compiled keyword matchers against the substring loops they replaced.
+Titles are random draws from a fixed vocabulary, seeded so every run sees the same corpus.
+
+Usage:
+  python benchmarks/bench_keywords.py              # 100k titles
+  python benchmarks/bench_keywords.py 500000       # custom title count
+"""
+
+import os
+import random
+import sys
+import time
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_curator import FALLBACK_TITLE_MATCHER
+from relevance import AI_KEYWORDS, RELEVANCE_MATCHER
+
+VOCABULARY = (
+    "said data cloud startup startups robotics robot tech technology meta metadata google openai "
+    "anthropic chatgpt gpt-4o llms neural quantum algorithm automation machine learning deep "
+    "artificial intelligence new news launches announces release major billion funding first "
+    "claude ai model models breakthrough the a of to in for on with says plans market city team "
+    "game price report week people sports weather election mountain rain maintain again paid"
+).split()
+
+# The keyword lists as the substring loops used them
+SUBSTRING_RELEVANCE = [keyword.rstrip('*') for keyword in AI_KEYWORDS]
+SUBSTRING_FALLBACK = {
+    'high': ['breakthrough', 'launches', 'announces', 'release', 'new', 'first', 'major', 'billion', 'funding'],
+    'ai': ['openai', 'anthropic', 'google ai', 'meta ai', 'chatgpt', 'gpt-4', 'claude', 'ai model']
+}
+
+
+def build_titles(count: int):
+    rng = random.Random(42)
+    return [" ".join(rng.choices(VOCABULARY, k=rng.randint(5, 12))).capitalize() for _ in range(count)]
+
+
+def substring_relevance(title: str) -> bool:
+    title_lower = title.lower()
+    return any(keyword in title_lower for keyword in SUBSTRING_RELEVANCE)
+
+
+def substring_fallback(title: str):
+    title_lower = title.lower()
+    return {keyword_class: {keyword for keyword in keywords if keyword in title_lower}
+            for keyword_class, keywords in SUBSTRING_FALLBACK.items()}
+
+
+def timed(function, titles):
+    started = time.perf_counter()
+    results = [function(title) for title in titles]
+    return results, time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    titles = build_titles(count)
+
+    print(f"{count} titles\n")
+    print(f"{'task':<12}{'method':<12}{'seconds':>9}{'titles/s':>12}{'matched':>9}")
+
+    for task, old, new in (
+        ('relevance', substring_relevance, RELEVANCE_MATCHER.search),
+        ('fallback', substring_fallback, FALLBACK_TITLE_MATCHER.matches),
+    ):
+        old_results, old_seconds = timed(old, titles)
+        new_results, new_seconds = timed(new, titles)
+        for method, results, seconds in (('substring', old_results, old_seconds),
+                                         ('compiled', new_results, new_seconds)):
+            matched = sum(1 for result in results if result and any(result.values() if isinstance(result, dict) else [result]))
+            print(f"{task:<12}{method:<12}{seconds:>9.3f}{count / seconds:>12,.0f}{matched:>9}")
+
+    # Titles the substring check called relevant only because of a keyword inside another word
+    false_positives = [title for title in titles if substring_relevance(title) and not RELEVANCE_MATCHER.search(title)]
+    print(f"\n{len(false_positives)} substring-only relevance matches, e.g.:")
+    for title in false_positives[:3]:
+        print(f"  {title}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark the local relevance model: train it on a synthetic LLM score history, then curate
+fresh candidates against the local fake OpenAI endpoint with and without it.
+The history and model go to a temporary directory; no API keys or network access are needed.
+
+Usage:
+  python benchmarks/bench_relevance_model.py              # 2000 history articles, 100 candidates
+  python benchmarks/bench_relevance_model.py 5000 200     # history size / candidate count
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_openai_server import FakeOpenAIServer
+from ai_curator import AIContentCurator
+from config import Config
+from models import Article
+from relevance_model import ScoreHistory, train
+
+IMPORTANT_WORDS = ['launches', 'billion', 'funding', 'breakthrough', 'openai', 'model', 'acquires', 'regulation']
+MINOR_WORDS = ['tips', 'deal', 'review', 'sale', 'podcast', 'recap', 'webinar', 'listicle']
+FILLER_WORDS = ['the', 'company', 'said', 'new', 'week', 'team', 'users', 'today', 'report', 'update', 'version']
+
+
+def synthetic_articles(count: int, seed: int):
+    """Articles whose simulated LLM score follows their important and minor words, with noise"""
+    rng = random.Random(seed)
+    articles, scores = [], []
+    for i in range(count):
+        important = rng.randint(0, 3)
+        minor = rng.randint(0, 3)
+        words = (rng.sample(IMPORTANT_WORDS, important) + rng.sample(MINOR_WORDS, minor)
+                 + rng.choices(FILLER_WORDS, k=30))
+        rng.shuffle(words)
+        articles.append(Article(
+            title=' '.join(words[:8]).capitalize(),
+            url=f"https://example.com/{seed}/{i}",
+            summary=' '.join(words[8:]),
+            source=rng.choice(['TechCrunch', 'Wired', 'Blog']),
+            published_date=datetime.now()
+        ))
+        scores.append(max(1.0, min(10.0, round(5 + 1.5 * important - 1.5 * minor + rng.gauss(0, 1)))))
+    return articles, scores
+
+
+def run(label: str, candidates):
+    """Curate the candidates and print how many LLM calls that took"""
+    curator = AIContentCurator()
+    started = time.perf_counter()
+    curator.curate_stream(list(candidates))
+    seconds = time.perf_counter() - started
+    local = curator.local_decisions.count('minor') + curator.local_decisions.count('important')
+    print(f"{label:<12}{len(curator.llm_calls):>7}{local:>8}{seconds:>10.2f}")
+
+
+def main():
+    history_size = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    candidate_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    workdir = tempfile.mkdtemp()
+    Config.CONTENT_CACHE_DB = os.path.join(workdir, 'content_cache.db')
+    Config.RELEVANCE_MODEL_PATH = os.path.join(workdir, 'relevance_model.npz')
+    Config.LLM_CACHE_ENABLED = False  # Every call must reach the server
+
+    articles, scores = synthetic_articles(history_size, seed=1)
+    ScoreHistory(Config.CONTENT_CACHE_DB).record(list(zip(articles, scores)))
+
+    started = time.perf_counter()
+    model = train(Config())
+    print(f"\ntrained on {history_size} scored articles in {time.perf_counter() - started:.2f}s\n")
+
+    server = FakeOpenAIServer(latency=0.05).start()
+    Config.OPENAI_BASE_URL = server.base_url
+    Config.OPENAI_API_KEY = "fake"
+
+    candidates, _ = synthetic_articles(candidate_count, seed=2)
+    started = time.perf_counter()
+    model.classify(candidates)
+    print(f"classified {candidate_count} candidates locally in {(time.perf_counter() - started) * 1000:.1f}ms\n")
+
+    print(f"{'model':<12}{'calls':>7}{'local':>8}{'seconds':>10}")
+    Config.RELEVANCE_MODEL_ENABLED = False
+    run('off', candidates)
+    Config.RELEVANCE_MODEL_ENABLED = True
+    run('on', synthetic_articles(candidate_count, seed=2)[0])
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark per-article importance scoring against batched scoring on the same candidates.
+Needs OPENAI_API_KEY; the candidates are built from the saved fixture pages.
+
+Usage:
+  python benchmarks/bench_scoring.py              # 15 candidates, batch size 5
+  python benchmarks/bench_scoring.py 15 15        # custom candidate count / batch size
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_curator import AIContentCurator
+from bench_extractors import load_fixtures
+from config import Config
+from models import Article
+
+
+def build_candidates(count: int):
+    """Make `count` candidate articles from the fixture texts"""
+    fixtures = load_fixtures()
+    candidates = []
+    for i in range(count):
+        name, _, text = fixtures[i % len(fixtures)]
+        candidates.append(Article(
+            title=f"{name.replace('_', ' ').title()} #{i}",
+            url=f"https://example.com/{i}",
+            summary=text[:800],
+            source="Benchmark",
+            published_date=datetime.now()
+        ))
+    return candidates
+
+
+def run(curator: AIContentCurator, label: str, score):
+    """Time one scoring pass and print its call, token and latency totals"""
+    curator.llm_calls = []
+    started = time.perf_counter()
+    scores = score()
+    seconds = time.perf_counter() - started
+
+    prompt_tokens = sum(call['prompt_tokens'] for call in curator.llm_calls)
+    completion_tokens = sum(call['completion_tokens'] for call in curator.llm_calls)
+    print(f"{label:<12}{len(curator.llm_calls):>7}{prompt_tokens:>10}{completion_tokens:>12}{seconds:>10.2f}")
+    return scores
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    Config.LLM_CACHE_ENABLED = False  # Every pass must reach the API
+    curator = AIContentCurator()
+    candidates = build_candidates(count)
+
+    print(f"{count} candidates, batch size {batch_size}, model {curator.config.OPENAI_MODEL}\n")
+    print(f"{'mode':<12}{'calls':>7}{'prompt':>10}{'completion':>12}{'seconds':>10}")
+
+    single = run(curator, 'per-article',
+                 lambda: [curator.score_article_importance(article) for article in candidates])
+    batched = run(curator, 'batched',
+                  lambda: [score for i in range(0, count, batch_size)
+                           for score in curator.score_articles_batch(candidates[i:i + batch_size])])
+
+    drift = sum(abs(a - b) for a, b in zip(single, batched)) / max(1, count)
+    print(f"\nmean absolute score difference: {drift:.2f}")
+
+
+if __name__ == "__main__":
+    main()
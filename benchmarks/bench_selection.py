@@ -0,0 +1,86 @@
+"""
+Benchmark candidate selection and top-5 selection as the number of articles grows.
+Compares the current code with the list-membership / full-sort versions it replaced,
+checks both pick the same articles, and reports time per article (flat means linear).
+
+Usage:
+  python benchmarks/bench_selection.py                     # 1k to 50k articles
+  python benchmarks/bench_selection.py 1000 10000 100000   # custom sizes
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('OPENAI_API_KEY', 'unused')  # The curator builds a client it never calls here
+
+from ai_curator import AIContentCurator
+from models import Article
+from relevance import MAX_CANDIDATES, MIN_RELEVANT_ARTICLES, is_relevant, select_candidates
+
+WORDS = "market city team game price report week people sports weather election update review".split()
+
+
+def build_articles(count: int, relevant: int):
+    """`count` articles, `relevant` of them with an AI keyword in the title, randomly scored"""
+    rng = random.Random(7)
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=6)) + (" AI" if i % max(1, count // relevant) == 0 else "")
+        articles.append(Article(
+            title=title, url=f"https://example.com/{i}", summary=title * 5, source="Bench",
+            published_date=datetime.now(), content=title * 50, importance_score=round(rng.uniform(1, 10), 1)
+        ))
+    return articles
+
+
+def old_select_candidates(articles):
+    relevant_articles = [article for article in articles if is_relevant(article)]
+    if len(relevant_articles) < MIN_RELEVANT_ARTICLES:
+        for article in articles:
+            if article not in relevant_articles:
+                relevant_articles.append(article)
+            if len(relevant_articles) >= MAX_CANDIDATES:
+                break
+    return relevant_articles
+
+
+def old_top_five(articles):
+    articles.sort(key=lambda x: x.importance_score, reverse=True)
+    return articles[:5]
+
+
+def timed(function, *args):
+    started = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 5_000, 10_000, 20_000, 50_000]
+    curator = AIContentCurator()
+
+    print(f"{'articles':>9}{'selected':>10}{'step':>12}{'old ms':>10}{'new ms':>10}{'new us/article':>16}{'same':>6}")
+    for count in sizes:
+        # Few relevant articles exercises the top-up loop; many sends thousands to top-k
+        for relevant in (5, count // 2):
+            articles = build_articles(count, relevant)
+
+            old, old_seconds = timed(old_select_candidates, articles)
+            new, new_seconds = timed(select_candidates, articles)
+            print(f"{count:>9}{len(new):>10}{'candidates':>12}{old_seconds * 1000:>10.2f}{new_seconds * 1000:>10.2f}"
+                  f"{new_seconds * 1e6 / count:>16.3f}{str(old == new):>6}")
+
+            old, old_seconds = timed(old_top_five, list(articles))
+            new, new_seconds = timed(curator._select_top_articles, list(articles))
+            print(f"{count:>9}{len(new):>10}{'top-5':>12}{old_seconds * 1000:>10.2f}{new_seconds * 1000:>10.2f}"
+                  f"{new_seconds * 1e6 / count:>16.3f}{str(old == new):>6}")
+
+
+if __name__ == "__main__":
+    main()
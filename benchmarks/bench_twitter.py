@@ -0,0 +1,116 @@
+"""
+Exercise batched Twitter search against a local stub client: calls per poll, since_id
+polling, tweets that gain likes after they are first seen, and rate-limit scheduling.
+The watermarks go to a temporary database; no API keys or network access are needed.
+
+Usage:
+  python benchmarks/bench_twitter.py              # 40 keywords
+  python benchmarks/bench_twitter.py 100          # custom keyword count
+"""
+
+import os
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import requests
+import tweepy
+
+# Add the project directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from content_collector import ContentCollector, tweet_id_at
+
+
+class StubTwitterClient:
+    """Answers search_recent_tweets from an in-memory timeline, like the v2 recent search endpoint"""
+
+    def __init__(self):
+        self.tweets = []
+        self.calls = 0
+        self.rate_limit_next = 0  # Seconds of 429 to return on the next call
+        self._sequence = 0
+
+    def post(self, text: str, likes: int, age: timedelta = timedelta(0)):
+        """Add a tweet posted `age` ago and return it, so its likes can change later"""
+        created_at = datetime.now(timezone.utc) - age
+        self._sequence += 1
+        tweet = SimpleNamespace(
+            id=tweet_id_at(created_at.astimezone().replace(tzinfo=None)) + self._sequence,
+            text=text,
+            created_at=created_at,
+            public_metrics={'like_count': likes}
+        )
+        self.tweets.append(tweet)
+        return tweet
+
+    def search_recent_tweets(self, query, since_id=None, max_results=10, tweet_fields=None):
+        self.calls += 1
+        if self.rate_limit_next:
+            response = requests.Response()
+            response.status_code = 429
+            response.reason = "Too Many Requests"
+            response.headers['x-rate-limit-reset'] = str(int(time.time() + self.rate_limit_next))
+            self.rate_limit_next = 0
+            raise tweepy.TooManyRequests(response, response_json={})
+
+        terms = query.split(' -is:retweet')[0].strip('()').split(' OR ')
+        terms = [term.strip('"').lower() for term in terms]
+        matches = sorted(
+            (tweet for tweet in self.tweets
+             if (since_id is None or tweet.id > int(since_id))
+             and any(re.search(rf"\b{re.escape(term)}\b", tweet.text.lower()) for term in terms)),
+            key=lambda tweet: tweet.id, reverse=True
+        )[:max_results]
+        meta = {'newest_id': str(matches[0].id), 'result_count': len(matches)} if matches else {'result_count': 0}
+        return SimpleNamespace(data=matches or None, meta=meta)
+
+
+def poll(collector: ContentCollector, client: StubTwitterClient, label: str):
+    """Run one collection and print the calls it made and the tweets it kept"""
+    client.calls = 0
+    started = time.perf_counter()
+    articles = collector.collect_twitter_content()
+    print(f"{label:<44}{client.calls:>6}{len(articles):>8}{time.perf_counter() - started:>9.2f}s")
+    return articles
+
+
+def main():
+    keyword_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+
+    Config.CONTENT_CACHE_DB = os.path.join(tempfile.mkdtemp(), 'content_cache.db')
+    Config.TWITTER_KEYWORDS = [f"topic{i}" for i in range(keyword_count)]
+    Config.TWITTER_RATE_LIMIT_RETRIES = 1
+
+    client = StubTwitterClient()
+    for i in range(keyword_count):
+        client.post(f"Old news about topic{i}", likes=50, age=timedelta(days=2))
+    rising = client.post("Fresh take on topic1", likes=0, age=timedelta(minutes=5))
+
+    print(f"{keyword_count} keywords\n")
+    print(f"{'poll':<44}{'calls':>6}{'tweets':>8}{'time':>10}")
+
+    Config.TWITTER_BATCHED_SEARCH = False
+    poll(ContentCollector(twitter_client=client), client, 'per-keyword')
+
+    Config.TWITTER_BATCHED_SEARCH = True
+    collector = ContentCollector(twitter_client=client)
+    poll(collector, client, 'batched, first poll')
+    collector.mark_entries_seen()  # The edition went out, so the watermarks are saved
+
+    poll(collector, client, 'batched, nothing new')
+    rising.public_metrics['like_count'] = 40
+    liked = poll(collector, client, 'batched, fresh tweet gained likes')
+    assert any(article.summary == rising.text for article in liked), "tweet that gained likes was not collected"
+
+    client.post("Breaking: topic2 launch", likes=99)
+    client.rate_limit_next = 2
+    poll(collector, client, 'batched, 429 with a 2s reset')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Local fake of the OpenAI chat completions endpoint for exercising the curator offline.
+Replies after a fixed latency (with an optional slow tail), answers each curation prompt
+shape with valid output, and returns 429 with Retry-After once more than `rate_limit`
+requests arrive in a second. It also answers the Anthropic Messages endpoint
+(/v1/messages), so two instances can stand in for both providers.
+
+Usage:
+  python benchmarks/fake_openai_server.py                  # port 8765, 0.5s latency
+  python benchmarks/fake_openai_server.py 8765 0.2 10      # port / latency / requests per second
+
+Then run the curator with OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=fake
+"""
+
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def fake_completion(prompt: str, json_mode: bool) -> str:
+    """Well-formed reply for whichever curation prompt this is"""
+    if json_mode and '"summary"' in prompt:
+        return json.dumps({"score": 7, "summary": "A fake summary of the article."})
+    if json_mode:
+        ids = [int(i) for i in re.findall(r"^\s*ID (\d+)$", prompt, re.MULTILINE)]
+        return json.dumps({"scores": [{"id": i, "score": 5 + i % 5} for i in ids]})
+    if "Rate the importance" in prompt:
+        return "7"
+    return "A fake summary of the article."
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output readable
+
+    def _send_json(self, status: int, body: dict, headers: dict = None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        server = self.server
+        server.requests += 1
+
+        if server.rate_limit and not server.admit():
+            server.rejected += 1
+            self._send_json(429, {"error": {"message": "Rate limit reached", "type": "requests"}},
+                            {"Retry-After": "1"})
+            return
+
+        time.sleep(server.slow_latency if server.rng.random() < server.slow_fraction else server.latency)
+
+        prompt = request["messages"][-1]["content"]
+        if self.path.endswith("/messages"):
+            # Anthropic has no JSON mode; the prompt asking for JSON is what decides the shape
+            content = fake_completion(prompt, "Respond with only JSON" in prompt)
+            self._send_json(200, {
+                "id": f"msg_fake_{server.requests}",
+                "type": "message",
+                "role": "assistant",
+                "model": request.get("model", "fake"),
+                "content": [{"type": "text", "text": content}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(content) // 4}
+            })
+            return
+
+        content = fake_completion(prompt, request.get("response_format", {}).get("type") == "json_object")
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 4
+        self._send_json(200, {
+            "id": f"chatcmpl-fake-{server.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        })
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 0.5, rate_limit: int = 0,
+                 slow_fraction: float = 0.0, slow_latency: float = 0.0):
+        super().__init__(("127.0.0.1", port), FakeOpenAIHandler)
+        self.latency = latency
+        self.rate_limit = rate_limit
+        # A `slow_fraction` of requests take `slow_latency` instead, to model a latency tail
+        self.slow_fraction = slow_fraction
+        self.slow_latency = slow_latency
+        self.rng = random.Random(3)
+        self.requests = 0
+        self.rejected = 0
+        self._recent = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    @property
+    def anthropic_base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def handle_error(self, request, client_address):
+        pass  # Clients cancelling hedged requests close connections mid-reply
+
+    def admit(self) -> bool:
+        """Sliding one-second window of admitted requests"""
+        with self._lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] > 1:
+                self._recent.popleft()
+            if len(self._recent) >= self.rate_limit:
+                return False
+            self._recent.append(now)
+            return True
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    rate_limit = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    server = FakeOpenAIServer(port, latency, rate_limit)
+    print(f"Fake OpenAI server on {server.base_url} (latency {latency}s, limit {rate_limit or 'none'}/s)")
+    server.serve_forever()
@@ -0,0 +1,132 @@
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import numpy as np
+from loguru import logger
+from config import Config
+from models import Article
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Mersenne prime modulus for the universal hash family (a * x + b) mod p
+_PRIME = np.uint64((1 << 61) - 1)
+
+
+@dataclass
+class StoryCluster:
+    """Near-duplicate articles covering one story; only the representative reaches the LLM"""
+    representative: Article
+    members: List[Article] = field(default_factory=list)
+
+    def share_curation(self):
+        """Give every member the representative's score and summary"""
+        for member in self.members:
+            member.importance_score = self.representative.importance_score
+            member.ai_summary = self.representative.ai_summary
+
+
+class StoryClusterer:
+    """Groups near-duplicate articles with MinHash signatures and LSH banding
+
+    Each article becomes a set of word shingles over its normalized title and text.
+    MinHash signatures estimate Jaccard similarity between those sets, and LSH
+    buckets signatures by band so only articles sharing a band are ever compared,
+    which keeps clustering near-linear in the number of articles.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config()
+        self.bands = self.config.CLUSTER_LSH_BANDS
+        self.rows = self.config.CLUSTER_LSH_ROWS
+        self.threshold = self.config.CLUSTER_SIMILARITY
+
+        rng = np.random.default_rng(1)  # Fixed seed so signatures are comparable across runs
+        permutations = self.bands * self.rows
+        self._a = rng.integers(1, 1 << 32, size=(permutations, 1), dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=(permutations, 1), dtype=np.uint64)
+
+    def shingles(self, article: Article) -> np.ndarray:
+        """Hashes of the word shingles of an article's title and leading text"""
+        text = f"{article.title} {article.content or article.summary}"
+        words = WORD_PATTERN.findall(text.lower())[:self.config.CLUSTER_MAX_WORDS]
+        size = self.config.CLUSTER_SHINGLE_SIZE
+        grams = {' '.join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))} if words else set()
+        return np.fromiter((zlib.crc32(gram.encode('utf-8')) for gram in grams), dtype=np.uint64, count=len(grams))
+
+    def signature(self, shingle_hashes: np.ndarray) -> np.ndarray:
+        """MinHash signature: the minimum of each hash permutation over the shingles"""
+        return ((self._a * shingle_hashes + self._b) % _PRIME).min(axis=1)
+
+    def cluster(self, articles: List[Article]) -> List[StoryCluster]:
+        """Cluster articles into stories, in order of each story's first article"""
+        parent = list(range(len(articles)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        signatures = {}
+        for index, article in enumerate(articles):
+            shingle_hashes = self.shingles(article)
+            if len(shingle_hashes):
+                signatures[index] = self.signature(shingle_hashes)
+
+        for band in range(self.bands):
+            buckets = {}
+            start = band * self.rows
+            for index, signature in signatures.items():
+                # Compare each article only with the first one in its bucket; union-find joins the rest
+                first = buckets.setdefault(signature[start:start + self.rows].tobytes(), index)
+                if first != index and find(first) != find(index):
+                    if np.mean(signatures[first] == signature) >= self.threshold:
+                        parent[find(index)] = find(first)
+
+        groups = {}
+        for index, article in enumerate(articles):
+            groups.setdefault(find(index), []).append(article)
+
+        clusters = []
+        for members in groups.values():
+            # The fullest text makes the best summary; ties keep collection order
+            representative = max(members, key=lambda article: len(article.content or article.summary))
+            clusters.append(StoryCluster(representative, [m for m in members if m is not representative]))
+
+        duplicates = len(articles) - len(clusters)
+        if duplicates:
+            logger.info(f"Clustered {len(articles)} articles into {len(clusters)} stories ({duplicates} near-duplicates)")
+        return clusters
+
+
+class StoryIndex:
+    """Incremental clustering for streams: keeps the first article of each story and recognizes later near-duplicates
+
+    A stream can't wait to pick the fullest article of a cluster, so the first
+    one to arrive represents the story and later near-duplicates are dropped.
+    """
+
+    def __init__(self, clusterer: StoryClusterer):
+        self.clusterer = clusterer
+        self._buckets: Dict[bytes, List[np.ndarray]] = {}
+        self.duplicates = 0
+
+    def add(self, article: Article) -> bool:
+        """Index an article, returning False if it repeats a story already indexed"""
+        shingle_hashes = self.clusterer.shingles(article)
+        if not len(shingle_hashes):
+            return True
+
+        signature = self.clusterer.signature(shingle_hashes)
+        rows = self.clusterer.rows
+        keys = [signature[band * rows:(band + 1) * rows].tobytes() for band in range(self.clusterer.bands)]
+        for key in keys:
+            for other in self._buckets.get(key, ()):
+                if np.mean(other == signature) >= self.clusterer.threshold:
+                    self.duplicates += 1
+                    return False
+
+        for key in keys:
+            self._buckets.setdefault(key, []).append(signature)
+        return True
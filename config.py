@@ -9,6 +9,77 @@ class Config:
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
     TWITTER_BEARER_TOKEN = os.getenv('TWITTER_BEARER_TOKEN')
     
+    # LLM Curation (SCORING_BATCH_SIZE=1 scores each article in its own request)
+    OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+    # Point at any OpenAI-compatible server (e.g. a local fake for testing)
+    OPENAI_BASE_URL = os.getenv('OPENAI_BASE_URL') or None
+    SCORING_BATCH_SIZE = int(os.getenv('SCORING_BATCH_SIZE', 1))
+    # 'separate' scores and summarizes in two requests; 'combined' gets both from one
+    CURATION_MODE = os.getenv('CURATION_MODE', 'separate').lower()
+    # Prompt budgets in tokens (exact with tiktoken installed, otherwise estimated from length)
+    SCORE_SUMMARY_TOKENS = int(os.getenv('SCORE_SUMMARY_TOKENS', 125))
+    SUMMARY_CONTENT_TOKENS = int(os.getenv('SUMMARY_CONTENT_TOKENS', 500))
+    # USD per 1K tokens for the run cost report (defaults are gpt-3.5-turbo list prices)
+    LLM_INPUT_COST_PER_1K = float(os.getenv('LLM_INPUT_COST_PER_1K', 0.0005))
+    LLM_OUTPUT_COST_PER_1K = float(os.getenv('LLM_OUTPUT_COST_PER_1K', 0.0015))
+    
+    # Provider Routing ('openai', 'anthropic', or 'hedged': race the other provider once the primary is slow)
+    LLM_ROUTING = os.getenv('LLM_ROUTING', 'openai').lower()
+    LLM_PRIMARY_PROVIDER = os.getenv('LLM_PRIMARY_PROVIDER', 'openai').lower()
+    # The hedge goes out at this percentile of the primary's recent latency, or after
+    # LLM_HEDGE_DELAY seconds until LLM_HEDGE_MIN_SAMPLES latencies have been seen
+    LLM_HEDGE_PERCENTILE = float(os.getenv('LLM_HEDGE_PERCENTILE', 90))
+    LLM_HEDGE_DELAY = float(os.getenv('LLM_HEDGE_DELAY', 2.0))
+    LLM_HEDGE_MIN_SAMPLES = int(os.getenv('LLM_HEDGE_MIN_SAMPLES', 20))
+    ANTHROPIC_MODEL = os.getenv('ANTHROPIC_MODEL', 'claude-3-haiku-20240307')
+    ANTHROPIC_BASE_URL = os.getenv('ANTHROPIC_BASE_URL') or None
+    ANTHROPIC_INPUT_COST_PER_1K = float(os.getenv('ANTHROPIC_INPUT_COST_PER_1K', 0.00025))
+    ANTHROPIC_OUTPUT_COST_PER_1K = float(os.getenv('ANTHROPIC_OUTPUT_COST_PER_1K', 0.00125))
+    
+    # Local Pre-Ranking (only the PRERANK_TOP_K best collected articles reach the LLM)
+    PRERANK_ENABLED = os.getenv('PRERANK_ENABLED', 'false').lower() == 'true'
+    PRERANK_TOP_K = int(os.getenv('PRERANK_TOP_K', 15))
+    PRERANK_HALF_LIFE_HOURS = float(os.getenv('PRERANK_HALF_LIFE_HOURS', 24))
+    PRERANK_TITLE_WEIGHT = float(os.getenv('PRERANK_TITLE_WEIGHT', 3))
+    # Comma-separated 'Source Name=weight' entries, e.g. 'TechCrunch=1.2,Twitter=0.8'
+    SOURCE_PRIORS = os.getenv('SOURCE_PRIORS', '').split(',')
+    
+    # Story Clustering (near-duplicate coverage is curated once; bands x rows MinHash permutations)
+    CLUSTERING_ENABLED = os.getenv('CLUSTERING_ENABLED', 'false').lower() == 'true'
+    CLUSTER_SIMILARITY = float(os.getenv('CLUSTER_SIMILARITY', 0.5))
+    CLUSTER_SHINGLE_SIZE = int(os.getenv('CLUSTER_SHINGLE_SIZE', 3))
+    CLUSTER_MAX_WORDS = int(os.getenv('CLUSTER_MAX_WORDS', 300))
+    CLUSTER_LSH_BANDS = int(os.getenv('CLUSTER_LSH_BANDS', 16))
+    CLUSTER_LSH_ROWS = int(os.getenv('CLUSTER_LSH_ROWS', 4))
+    
+    # Novelty Index (skip stories featured in editions sent within the retention window)
+    NOVELTY_ENABLED = os.getenv('NOVELTY_ENABLED', 'false').lower() == 'true'
+    NOVELTY_RETENTION_DAYS = float(os.getenv('NOVELTY_RETENTION_DAYS', 30))
+    
+    # Async LLM Engine (request and token budgets are per minute; 0 disables a budget)
+    ASYNC_CURATION = os.getenv('ASYNC_CURATION', 'false').lower() == 'true'
+    LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', 4))
+    LLM_REQUESTS_PER_MINUTE = int(os.getenv('LLM_REQUESTS_PER_MINUTE', 500))
+    LLM_TOKENS_PER_MINUTE = int(os.getenv('LLM_TOKENS_PER_MINUTE', 200000))
+    LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', 60))
+    LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', 3))
+    LLM_MAX_RETRY_WAIT = float(os.getenv('LLM_MAX_RETRY_WAIT', 60))
+    # Consecutive failed LLM calls before curation switches to heuristics, and seconds until a retry probe
+    LLM_BREAKER_THRESHOLD = int(os.getenv('LLM_BREAKER_THRESHOLD', 3))
+    LLM_BREAKER_COOLDOWN = float(os.getenv('LLM_BREAKER_COOLDOWN', 60))
+    
+    # Local Relevance Model (clear cases are scored locally; train with `python relevance_model.py train`)
+    RELEVANCE_MODEL_ENABLED = os.getenv('RELEVANCE_MODEL_ENABLED', 'false').lower() == 'true'
+    RELEVANCE_MODEL_PATH = os.getenv('RELEVANCE_MODEL_PATH', 'relevance_model.npz')
+    RELEVANCE_MODEL_FEATURES = int(os.getenv('RELEVANCE_MODEL_FEATURES', 2 ** 18))
+    # LLM scores at or above this count as important
+    RELEVANCE_MODEL_POSITIVE_SCORE = float(os.getenv('RELEVANCE_MODEL_POSITIVE_SCORE', 7))
+    # Share of held-out clear cases the LLM must agree with; sets how wide the local bands are
+    RELEVANCE_MODEL_CONFIDENCE = float(os.getenv('RELEVANCE_MODEL_CONFIDENCE', 0.95))
+    RELEVANCE_MODEL_MIN_HISTORY = int(os.getenv('RELEVANCE_MODEL_MIN_HISTORY', 200))
+    # Share of clear cases still sent to the LLM, so `python relevance_model.py evaluate` has labels to check
+    RELEVANCE_MODEL_AUDIT_RATE = float(os.getenv('RELEVANCE_MODEL_AUDIT_RATE', 0.05))
+    
     # Email Configuration
     SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
     SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
@@ -29,6 +100,70 @@ class Config:
     TWITTER_KEYWORDS = os.getenv('TWITTER_KEYWORDS', '').split(',')
     MAX_ARTICLES_PER_SOURCE = int(os.getenv('MAX_ARTICLES_PER_SOURCE', 5))
     
+    # Batched Twitter Search (OR-packed queries polled incrementally with since_id)
+    TWITTER_BATCHED_SEARCH = os.getenv('TWITTER_BATCHED_SEARCH', 'false').lower() == 'true'
+    TWITTER_QUERY_MAX_LENGTH = int(os.getenv('TWITTER_QUERY_MAX_LENGTH', 512))
+    TWITTER_MAX_RESULTS = int(os.getenv('TWITTER_MAX_RESULTS', 100))
+    TWITTER_RATE_LIMIT_RETRIES = int(os.getenv('TWITTER_RATE_LIMIT_RETRIES', 2))
+    TWITTER_MAX_RATE_LIMIT_WAIT = float(os.getenv('TWITTER_MAX_RATE_LIMIT_WAIT', 900))
+    # Tweets this recent are searched again on every poll so ones that gain likes later are still collected
+    TWITTER_ENGAGEMENT_WINDOW_HOURS = float(os.getenv('TWITTER_ENGAGEMENT_WINDOW_HOURS', 24))
+    
+    # Shared HTTP Layer (used by feed, article and Twitter fetches)
+    HTTP_USER_AGENT = os.getenv('HTTP_USER_AGENT', 'Mozilla/5.0 (compatible; AINewsletterBot/1.0)')
+    HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 5))
+    HTTP_RETRIES = int(os.getenv('HTTP_RETRIES', 2))
+    HTTP_RETRY_BACKOFF = float(os.getenv('HTTP_RETRY_BACKOFF', 0.5))
+    HTTP_POOL_HOSTS = int(os.getenv('HTTP_POOL_HOSTS', 64))
+    HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 8))
+    HTTP2_ENABLED = os.getenv('HTTP2_ENABLED', 'false').lower() == 'true'
+    
+    # Feed Fetching (RSS_FETCH_WORKERS=1 fetches feeds one at a time)
+    RSS_FETCH_WORKERS = int(os.getenv('RSS_FETCH_WORKERS', 8))
+    RSS_FEED_TIMEOUT = float(os.getenv('RSS_FEED_TIMEOUT', 15))
+    RSS_FETCH_DEADLINE = float(os.getenv('RSS_FETCH_DEADLINE', 120))
+    
+    # Full-Text Extraction (ENHANCE_WORKERS=1 enhances articles one at a time)
+    ENHANCE_WORKERS = int(os.getenv('ENHANCE_WORKERS', 8))
+    ENHANCE_PER_HOST = int(os.getenv('ENHANCE_PER_HOST', 2))
+    ARTICLE_TIMEOUT = float(os.getenv('ARTICLE_TIMEOUT', 20))
+    ARTICLE_MAX_BYTES = int(os.getenv('ARTICLE_MAX_BYTES', 2 * 1024 * 1024))
+    PREFILTER_BEFORE_ENHANCE = os.getenv('PREFILTER_BEFORE_ENHANCE', 'true').lower() == 'true'
+    # 'fast' (lxml heuristic, newspaper3k fallback), 'lxml' or 'newspaper'
+    CONTENT_EXTRACTOR = os.getenv('CONTENT_EXTRACTOR', 'fast')
+    EXTRACT_TARGET_CHARS = int(os.getenv('EXTRACT_TARGET_CHARS', 2000))
+    EXTRACT_MIN_CHARS = int(os.getenv('EXTRACT_MIN_CHARS', 500))
+    # Parse pages in this many worker processes (0 parses in the download threads)
+    EXTRACT_PROCESSES = int(os.getenv('EXTRACT_PROCESSES', 0))
+    
+    # Streaming Pipeline (curation starts while collection is still running)
+    STREAMING_PIPELINE = os.getenv('STREAMING_PIPELINE', 'false').lower() == 'true'
+    STREAM_QUEUE_SIZE = int(os.getenv('STREAM_QUEUE_SIZE', 20))
+    
+    # Local Caches
+    CONTENT_CACHE_DB = os.getenv('CONTENT_CACHE_DB', 'content_cache.db')
+    FEED_CACHE_ENABLED = os.getenv('FEED_CACHE_ENABLED', 'true').lower() == 'true'
+    ARTICLE_CACHE_ENABLED = os.getenv('ARTICLE_CACHE_ENABLED', 'true').lower() == 'true'
+    ARTICLE_CACHE_TTL_HOURS = float(os.getenv('ARTICLE_CACHE_TTL_HOURS', 72))
+    ARTICLE_CACHE_MAX_MB = int(os.getenv('ARTICLE_CACHE_MAX_MB', 200))
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_TTL_HOURS = float(os.getenv('LLM_CACHE_TTL_HOURS', 168))
+    LLM_CACHE_MAX_MB = int(os.getenv('LLM_CACHE_MAX_MB', 50))
+    
+    # Adaptive Feed Polling (keeps a local article store warm between editions)
+    FEED_POLLING = os.getenv('FEED_POLLING', 'false').lower() == 'true'
+    POLL_MIN_INTERVAL = float(os.getenv('POLL_MIN_INTERVAL', 600))
+    POLL_MAX_INTERVAL = float(os.getenv('POLL_MAX_INTERVAL', 86400))
+    POLL_INTERVAL_FACTOR = float(os.getenv('POLL_INTERVAL_FACTOR', 0.5))
+    POLL_JITTER = float(os.getenv('POLL_JITTER', 0.1))
+    # Feeds not polled successfully within this many of their intervals are fetched live instead
+    POLL_STALE_FACTOR = float(os.getenv('POLL_STALE_FACTOR', 2))
+    ARTICLE_STORE_RETENTION_DAYS = float(os.getenv('ARTICLE_STORE_RETENTION_DAYS', 14))
+    
+    # Incremental Collection (only emit feed entries not processed by an earlier run)
+    INCREMENTAL_COLLECTION = os.getenv('INCREMENTAL_COLLECTION', 'false').lower() == 'true'
+    FORCE_FULL_RESCAN = os.getenv('FORCE_FULL_RESCAN', 'false').lower() == 'true'
+    
     @classmethod
     def validate_config(cls):
         """Validate that all required configuration is present"""
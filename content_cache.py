@@ -0,0 +1,569 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from loguru import logger
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src', 'cmpid', 'ncid', 'guccounter'}
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL so the same article from different feeds maps to one key"""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip('/') or '/'
+
+    return urlunsplit(('https' if parts.scheme in ('http', 'https') else parts.scheme,
+                       host, path, urlencode(query), ''))
+
+
+class FeedCache:
+    """Persists feed validators (ETag/Last-Modified) and parsed entries for conditional GETs"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the feed cache table if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                feed_url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                feed_title TEXT,
+                entries TEXT NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get(self, feed_url: str) -> Optional[dict]:
+        """Return the cached validators and entries for a feed, if any"""
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                'SELECT etag, last_modified, feed_title, entries FROM feed_cache WHERE feed_url = ?',
+                (feed_url,)
+            ).fetchone()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading feed cache for {feed_url}: {e}")
+            return None
+
+        if not row:
+            return None
+
+        return {
+            'etag': row[0],
+            'last_modified': row[1],
+            'feed_title': row[2],
+            'entries': json.loads(row[3])
+        }
+
+    def put(self, feed_url: str, etag: Optional[str], last_modified: Optional[str],
+            feed_title: str, entries: List[dict]):
+        """Store the latest validators and parsed entries for a feed"""
+        try:
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO feed_cache '
+                '(feed_url, etag, last_modified, feed_title, entries, fetched_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (feed_url, etag, last_modified, feed_title, json.dumps(entries), datetime.now().isoformat())
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing feed cache for {feed_url}: {e}")
+
+
+class ArticleCache:
+    """On-disk cache of extracted article text keyed by canonical URL, with TTL and size eviction"""
+
+    def __init__(self, db_path: str, ttl_hours: float, max_bytes: int):
+        self.db_path = db_path
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        self._init_database()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the article cache table if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS article_cache (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at TEXT NOT NULL,
+                accessed_at TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(canonical_url(url).encode('utf-8')).hexdigest()
+
+    def _record(self, hit: bool):
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def reset_stats(self):
+        """Start counting hits and misses for a new run"""
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached text for a URL, or None if missing or expired"""
+        key = self._key(url)
+        now = datetime.now()
+
+        try:
+            conn = self._connect()
+            row = conn.execute('SELECT text, stored_at FROM article_cache WHERE url_key = ?', (key,)).fetchone()
+            if row and now - datetime.fromisoformat(row[1]) <= self.ttl:
+                conn.execute('UPDATE article_cache SET accessed_at = ? WHERE url_key = ?', (now.isoformat(), key))
+                conn.commit()
+                conn.close()
+                self._record(hit=True)
+                return row[0]
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading article cache for {url}: {e}")
+
+        self._record(hit=False)
+        return None
+
+    def put(self, url: str, text: str):
+        """Store extracted text for a URL"""
+        now = datetime.now().isoformat()
+
+        try:
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO article_cache (url_key, url, text, size, stored_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (self._key(url), url, text, len(text.encode('utf-8')), now, now)
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing article cache for {url}: {e}")
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under the size cap"""
+        cutoff = (datetime.now() - self.ttl).isoformat()
+
+        try:
+            conn = self._connect()
+            expired = conn.execute('DELETE FROM article_cache WHERE stored_at < ?', (cutoff,)).rowcount
+            oversize = conn.execute('''
+                DELETE FROM article_cache WHERE url_key IN (
+                    SELECT url_key FROM (
+                        SELECT url_key, SUM(size) OVER (ORDER BY accessed_at DESC, url_key) AS running
+                        FROM article_cache
+                    ) WHERE running > ?
+                )
+            ''', (self.max_bytes,)).rowcount
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error evicting article cache: {e}")
+            return 0
+
+        return expired + oversize
+
+
+class LLMResponseCache:
+    """On-disk cache of LLM completions keyed by model, prompt template version and request content hash"""
+
+    def __init__(self, db_path: str, ttl_hours: float, max_bytes: int):
+        self.db_path = db_path
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.saved_tokens = 0
+        self._stats_lock = threading.Lock()
+        self._init_database()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the LLM response cache table if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                template TEXT NOT NULL,
+                response TEXT NOT NULL,
+                tokens INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at TEXT NOT NULL,
+                accessed_at TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def key(model: str, template: str, request: dict) -> str:
+        """Cache key for a request; any change to the model, template version or content misses"""
+        content_hash = hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+        return hashlib.sha256(f"{model}\0{template}\0{content_hash}".encode('utf-8')).hexdigest()
+
+    def reset_stats(self):
+        """Start counting hits and misses for a new run"""
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+            self.saved_tokens = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None if missing or expired"""
+        now = datetime.now()
+        result = None
+
+        try:
+            conn = self._connect()
+            row = conn.execute('SELECT response, tokens, stored_at FROM llm_cache WHERE cache_key = ?', (key,)).fetchone()
+            if row and now - datetime.fromisoformat(row[2]) <= self.ttl:
+                conn.execute('UPDATE llm_cache SET accessed_at = ? WHERE cache_key = ?', (now.isoformat(), key))
+                conn.commit()
+                result = row
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading LLM cache: {e}")
+
+        with self._stats_lock:
+            if result:
+                self.hits += 1
+                self.saved_tokens += result[1]
+            else:
+                self.misses += 1
+
+        return result[0] if result else None
+
+    def put(self, key: str, model: str, template: str, response: str, tokens: int):
+        """Store a completion and the tokens it cost"""
+        now = datetime.now().isoformat()
+
+        try:
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO llm_cache '
+                '(cache_key, model, template, response, tokens, size, stored_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, model, template, response, tokens, len(response.encode('utf-8')), now, now)
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing LLM cache: {e}")
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under the size cap"""
+        cutoff = (datetime.now() - self.ttl).isoformat()
+
+        try:
+            conn = self._connect()
+            expired = conn.execute('DELETE FROM llm_cache WHERE stored_at < ?', (cutoff,)).rowcount
+            oversize = conn.execute('''
+                DELETE FROM llm_cache WHERE cache_key IN (
+                    SELECT cache_key FROM (
+                        SELECT cache_key, SUM(size) OVER (ORDER BY accessed_at DESC, cache_key) AS running
+                        FROM llm_cache
+                    ) WHERE running > ?
+                )
+            ''', (self.max_bytes,)).rowcount
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error evicting LLM cache: {e}")
+            return 0
+
+        return expired + oversize
+
+
+class SeenEntryStore:
+    """Remembers which feed entries were already processed, and what they looked like then"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the seen entries table if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS seen_entries (
+                entry_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def entry_key(feed_url: str, entry: dict) -> str:
+        """Identify an entry by its feed and GUID, falling back to its link"""
+        entry_id = entry.get('id') or entry['link']
+        return hashlib.sha256(f"{feed_url}|{entry_id}".encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def content_hash(entry: dict) -> str:
+        """Hash the parts of an entry that would change what we publish about it"""
+        return hashlib.sha256(f"{entry['title']}\n{entry['summary']}".encode('utf-8')).hexdigest()
+
+    def filter_unseen(self, feed_url: str, entries: List[dict]) -> List[dict]:
+        """Return the entries that are new or whose content changed since they were marked seen"""
+        if not entries:
+            return []
+
+        keys = [self.entry_key(feed_url, entry) for entry in entries]
+        try:
+            conn = self._connect()
+            placeholders = ','.join('?' * len(keys))
+            known = dict(conn.execute(
+                f'SELECT entry_key, content_hash FROM seen_entries WHERE entry_key IN ({placeholders})', keys
+            ).fetchall())
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading seen entries for {feed_url}: {e}")
+            return entries
+
+        return [
+            entry for key, entry in zip(keys, entries)
+            if known.get(key) != self.content_hash(entry)
+        ]
+
+    def mark_seen(self, marks: Dict[str, str]):
+        """Record entry keys with their content hashes as processed"""
+        if not marks:
+            return
+
+        now = datetime.now().isoformat()
+        try:
+            conn = self._connect()
+            conn.executemany('''
+                INSERT INTO seen_entries (entry_key, content_hash, first_seen, last_seen) VALUES (?, ?, ?, ?)
+                ON CONFLICT(entry_key) DO UPDATE SET content_hash = excluded.content_hash, last_seen = excluded.last_seen
+            ''', [(key, content_hash, now, now) for key, content_hash in marks.items()])
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error marking entries as seen: {e}")
+
+
+class TwitterWatermarks:
+    """Persists the newest tweet ID seen per search query, used as since_id on the next poll"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the watermark table if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS twitter_watermarks (
+                query TEXT PRIMARY KEY,
+                since_id TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def get(self, query: str) -> Optional[str]:
+        """Return the since_id for a query, if it was polled before"""
+        try:
+            conn = self._connect()
+            row = conn.execute('SELECT since_id FROM twitter_watermarks WHERE query = ?', (query,)).fetchone()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading Twitter watermark: {e}")
+            return None
+
+        return row[0] if row else None
+
+    def set(self, query: str, since_id: str):
+        """Advance the watermark for a query"""
+        try:
+            conn = self._connect()
+            conn.execute(
+                'INSERT OR REPLACE INTO twitter_watermarks (query, since_id, updated_at) VALUES (?, ?, ?)',
+                (query, str(since_id), datetime.now().isoformat())
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing Twitter watermark: {e}")
+
+
+class ArticleStore:
+    """Local store of feed entries kept warm by the feed poller, read at send time instead of crawling"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the stored entries and poll state tables if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS stored_entries (
+                feed_url TEXT NOT NULL,
+                entry_id TEXT NOT NULL,
+                feed_title TEXT NOT NULL,
+                entry TEXT NOT NULL,
+                published TEXT,
+                stored_at TEXT NOT NULL,
+                PRIMARY KEY (feed_url, entry_id)
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS feed_poll_state (
+                feed_url TEXT PRIMARY KEY,
+                interval_seconds REAL NOT NULL,
+                next_poll_at REAL NOT NULL,
+                last_polled_at REAL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def save_entries(self, feed_url: str, feed_title: str, entries: List[dict]):
+        """Insert or refresh a feed's entries"""
+        now = datetime.now().isoformat()
+        rows = [
+            (feed_url, entry.get('id') or entry['link'], feed_title, json.dumps(entry),
+             datetime(*entry['published']).isoformat() if entry['published'] else now, now)
+            for entry in entries
+        ]
+
+        try:
+            conn = self._connect()
+            conn.executemany(
+                'INSERT OR REPLACE INTO stored_entries (feed_url, entry_id, feed_title, entry, published, stored_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)', rows
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error storing entries for {feed_url}: {e}")
+
+    def load_entries(self, feed_url: str, since: datetime, limit: int,
+                     stale_factor: float) -> Optional[Tuple[str, List[dict]]]:
+        """Return (feed_title, newest entries) for a feed, or None if the poller is not keeping it fresh
+
+        A feed counts as fresh while its last successful poll is less than
+        `stale_factor` of its polling intervals old.
+        """
+        try:
+            conn = self._connect()
+            state = conn.execute(
+                'SELECT interval_seconds, last_polled_at FROM feed_poll_state WHERE feed_url = ?', (feed_url,)
+            ).fetchone()
+            fresh = state is not None and state[1] is not None and time.time() - state[1] <= state[0] * stale_factor
+            rows = conn.execute(
+                'SELECT feed_title, entry FROM stored_entries WHERE feed_url = ? AND published >= ? '
+                'ORDER BY published DESC LIMIT ?',
+                (feed_url, since.isoformat(), limit)
+            ).fetchall() if fresh else []
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading stored entries for {feed_url}: {e}")
+            return None
+
+        if not fresh:
+            return None
+        feed_title = rows[0][0] if rows else 'RSS Feed'
+        return feed_title, [json.loads(row[1]) for row in rows]
+
+    def compact(self, max_age_days: float) -> int:
+        """Drop entries published more than max_age_days ago"""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        try:
+            conn = self._connect()
+            removed = conn.execute('DELETE FROM stored_entries WHERE published < ?', (cutoff,)).rowcount
+            conn.commit()
+            conn.close()
+            return removed
+        except sqlite3.Error as e:
+            logger.error(f"Error compacting article store: {e}")
+            return 0
+
+    def load_poll_state(self) -> Dict[str, Tuple[float, float]]:
+        """Return {feed_url: (interval_seconds, next_poll_at)}"""
+        try:
+            conn = self._connect()
+            rows = conn.execute('SELECT feed_url, interval_seconds, next_poll_at FROM feed_poll_state').fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading feed poll state: {e}")
+            return {}
+
+        return {row[0]: (row[1], row[2]) for row in rows}
+
+    def save_poll_state(self, feed_url: str, interval_seconds: float, next_poll_at: float,
+                        polled_at: Optional[float]):
+        """Record a feed's learned interval and next due time, and when it was last polled successfully"""
+        try:
+            conn = self._connect()
+            # A failed poll (polled_at None) keeps the time of the last successful one
+            conn.execute(
+                'INSERT INTO feed_poll_state (feed_url, interval_seconds, next_poll_at, last_polled_at) '
+                'VALUES (?, ?, ?, ?) ON CONFLICT (feed_url) DO UPDATE SET '
+                'interval_seconds = excluded.interval_seconds, next_poll_at = excluded.next_poll_at, '
+                'last_polled_at = COALESCE(excluded.last_polled_at, last_polled_at)',
+                (feed_url, interval_seconds, next_poll_at, polled_at)
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error saving poll state for {feed_url}: {e}")
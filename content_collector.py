@@ -1,71 +1,470 @@
 import feedparser
 import tweepy
+import re
 import requests
-from newspaper import Article as NewspaperArticle
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
 from models import Article
 from config import Config
 
+try:
+    import httpx
+except ImportError:  # HTTP/2 support is optional
+    httpx = None
+from extractors import build_extractor, extract_in_worker, html_to_text, init_worker
+from content_cache import ArticleCache, ArticleStore, FeedCache, SeenEntryStore, TwitterWatermarks, canonical_url
+from clustering import StoryClusterer, StoryIndex
+from novelty import NoveltyIndex
+from ranking import PreRanker
+from relevance import MAX_CANDIDATES, MIN_RELEVANT_ARTICLES, is_relevant, select_candidates
+
+# Marks the end of a streaming collection run
+_STREAM_END = object()
+
+# Tweet IDs are snowflakes: milliseconds since this epoch, shifted left 22 bits
+TWITTER_EPOCH_MS = 1288834974657
+# Recent search only accepts a since_id from the last 7 days
+TWITTER_SEARCH_WINDOW = timedelta(days=7) - timedelta(hours=1)
+
+
+def tweet_id_at(moment: datetime) -> int:
+    """The smallest tweet ID that could have been posted at `moment`"""
+    return max(0, int(moment.timestamp() * 1000) - TWITTER_EPOCH_MS) << 22
+
+
+@dataclass
+class HttpResponse:
+    """Body and metadata of a completed fetch"""
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    
+    @property
+    def text(self) -> str:
+        """Decode the body using the charset from Content-Type, defaulting to UTF-8"""
+        match = re.search(r'charset=["\']?([\w-]+)', self.headers.get('content-type', ''), re.IGNORECASE)
+        try:
+            return self.content.decode(match.group(1) if match else 'utf-8', errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+    
+    def raise_for_status(self):
+        """Raise for 4xx/5xx responses, like requests does"""
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error fetching {self.url}")
+
+
+class HttpClient:
+    """Shared HTTP layer for every outbound fetch
+    
+    Keeps one pooled keep-alive session (or an HTTP/2 client when enabled and
+    available), applies the same timeouts and retries everywhere, and counts
+    requests, bytes and latency per host.
+    """
+    
+    def __init__(self, config: Config):
+        self.config = config
+        self.host_stats: Dict[str, Dict[str, float]] = {}
+        self._stats_lock = threading.Lock()
+        
+        self.session = self._build_session([429, 500, 502, 503, 504])
+        # API clients that schedule around their own rate-limit headers must see 429s at once
+        self.api_session = self._build_session([500, 502, 503, 504])
+        
+        self.http2_client = self._setup_http2_client() if config.HTTP2_ENABLED else None
+    
+    def _build_session(self, retry_statuses: List[int]) -> requests.Session:
+        """A pooled keep-alive session retrying connection errors and the given statuses"""
+        session = requests.Session()
+        session.headers['User-Agent'] = self.config.HTTP_USER_AGENT
+        retry = Retry(
+            total=self.config.HTTP_RETRIES,
+            backoff_factor=self.config.HTTP_RETRY_BACKOFF,
+            status_forcelist=retry_statuses,
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.HTTP_POOL_HOSTS,
+            pool_maxsize=self.config.HTTP_POOL_SIZE,
+            max_retries=retry
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _setup_http2_client(self):
+        """Setup an httpx client speaking HTTP/2, if httpx and h2 are installed"""
+        if httpx is None:
+            logger.warning("HTTP2_ENABLED is set but httpx is not installed; using HTTP/1.1")
+            return None
+        
+        try:
+            return httpx.Client(
+                http2=True,
+                headers={'User-Agent': self.config.HTTP_USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=self.config.HTTP_POOL_HOSTS * self.config.HTTP_POOL_SIZE,
+                    max_keepalive_connections=self.config.HTTP_POOL_SIZE
+                ),
+                transport=httpx.HTTPTransport(http2=True, retries=self.config.HTTP_RETRIES),
+                follow_redirects=True
+            )
+        except ImportError as e:
+            logger.warning(f"HTTP/2 unavailable ({e}); using HTTP/1.1")
+            return None
+    
+    def get(self, url: str, timeout: float, headers: Optional[Dict[str, str]] = None,
+            max_bytes: Optional[int] = None) -> Optional[HttpResponse]:
+        """Fetch a URL, returning None if the body exceeds max_bytes or takes longer than timeout"""
+        host = urlparse(url).netloc.lower()
+        started = time.monotonic()
+        deadline = started + timeout
+        size = 0
+        failed = False
+        
+        try:
+            if self.http2_client:
+                stream = self.http2_client.stream(
+                    'GET', url, headers=headers,
+                    timeout=httpx.Timeout(timeout, connect=self.config.HTTP_CONNECT_TIMEOUT)
+                )
+            else:
+                stream = self.session.get(
+                    url, headers=headers, stream=True,
+                    timeout=(self.config.HTTP_CONNECT_TIMEOUT, timeout)
+                )
+            
+            with stream as response:
+                response_headers = {key.lower(): value for key, value in response.headers.items()}
+                if max_bytes and int(response_headers.get('content-length') or 0) > max_bytes:
+                    logger.warning(f"Skipping response larger than {max_bytes} bytes: {url}")
+                    return None
+                
+                chunks = []
+                body = response.iter_bytes(64 * 1024) if self.http2_client else response.iter_content(64 * 1024)
+                for chunk in body:
+                    size += len(chunk)
+                    if max_bytes and size > max_bytes:
+                        logger.warning(f"Skipping response larger than {max_bytes} bytes: {url}")
+                        return None
+                    if time.monotonic() > deadline:
+                        logger.warning(f"Download exceeded {timeout}s: {url}")
+                        return None
+                    chunks.append(chunk)
+                
+                return HttpResponse(
+                    url=str(response.url),
+                    status_code=response.status_code,
+                    headers=response_headers,
+                    content=b''.join(chunks)
+                )
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._record(host, started, size, failed)
+    
+    def _record(self, host: str, started: float, size: int, failed: bool):
+        """Add one request to the per-host counters"""
+        with self._stats_lock:
+            stats = self.host_stats.setdefault(host, {'requests': 0, 'errors': 0, 'bytes': 0, 'seconds': 0.0})
+            if failed:
+                stats['errors'] += 1
+                return
+            stats['requests'] += 1
+            stats['bytes'] += size
+            stats['seconds'] += time.monotonic() - started
+    
+    def reset_stats(self):
+        """Start counting for a new run"""
+        with self._stats_lock:
+            self.host_stats = {}
+    
+    def log_stats(self):
+        """Log request, byte and latency totals per host"""
+        with self._stats_lock:
+            host_stats = dict(self.host_stats)
+        
+        for host, stats in sorted(host_stats.items(), key=lambda item: item[1]['bytes'], reverse=True):
+            average = stats['seconds'] / stats['requests'] if stats['requests'] else 0.0
+            logger.info(
+                f"HTTP {host}: {stats['requests']} requests, {stats['errors']} errors, "
+                f"{stats['bytes'] / 1024:.1f} KiB, {average:.2f}s avg"
+            )
+
+
 class ContentCollector:
     """Collects content from various sources"""
     
-    def __init__(self):
+    def __init__(self, twitter_client=None):
         self.config = Config()
-        self.twitter_client = self._setup_twitter_client()
+        self.http = HttpClient(self.config)
+        self.twitter_client = twitter_client or self._setup_twitter_client()
+        self.twitter_watermarks = TwitterWatermarks(self.config.CONTENT_CACHE_DB) if self.config.TWITTER_BATCHED_SEARCH else None
+        self._twitter_resume_at = 0.0
+        self.feed_timings: Dict[str, float] = {}
+        self.feeds_not_modified: Set[str] = set()
+        self.extractor = build_extractor(self.config)
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+        self._extract_pool_lock = threading.Lock()
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self.feed_cache = FeedCache(self.config.CONTENT_CACHE_DB) if self.config.FEED_CACHE_ENABLED else None
+        self.article_cache = ArticleCache(
+            self.config.CONTENT_CACHE_DB,
+            ttl_hours=self.config.ARTICLE_CACHE_TTL_HOURS,
+            max_bytes=self.config.ARTICLE_CACHE_MAX_MB * 1024 * 1024
+        ) if self.config.ARTICLE_CACHE_ENABLED else None
+        self.article_store = ArticleStore(self.config.CONTENT_CACHE_DB) if self.config.FEED_POLLING else None
+        self.prerank = PreRanker(self.config) if self.config.PRERANK_ENABLED else None
+        self.clusterer = StoryClusterer(self.config) if self.config.CLUSTERING_ENABLED else None
+        self.novelty = NoveltyIndex(self.config) if self.config.NOVELTY_ENABLED else None
+        self.seen_store = SeenEntryStore(self.config.CONTENT_CACHE_DB) if self.config.INCREMENTAL_COLLECTION else None
+        self._pending_seen: Dict[str, str] = {}
+        self._pending_seen_lock = threading.Lock()
+        self._pending_watermarks: Dict[str, str] = {}
     
     def _setup_twitter_client(self):
         """Setup Twitter API client"""
         if self.config.TWITTER_BEARER_TOKEN:
-            return tweepy.Client(bearer_token=self.config.TWITTER_BEARER_TOKEN)
+            client = tweepy.Client(bearer_token=self.config.TWITTER_BEARER_TOKEN)
+            # Pooled keep-alive connections, without retrying 429s the rate-limit scheduling handles
+            client.session = self.http.api_session
+            return client
         return None
     
     def collect_rss_articles(self) -> List[Article]:
         """Collect articles from RSS feeds"""
+        feed_urls = [feed_url.strip() for feed_url in self.config.RSS_FEEDS if feed_url.strip()]
+        deadline = self.config.RSS_FETCH_DEADLINE
+        workers = min(max(1, self.config.RSS_FETCH_WORKERS), max(1, len(feed_urls)))
+        self.feed_timings = {}
+        self.feeds_not_modified = set()
+        
+        results = {}
+        started = time.monotonic()
+        
+        if workers == 1:
+            for feed_url in feed_urls:
+                if time.monotonic() - started > deadline:
+                    logger.warning(f"RSS fetch deadline of {deadline}s reached, skipping: {feed_url}")
+                    continue
+                results[feed_url], self.feed_timings[feed_url], seen_marks = self._collect_feed(feed_url)
+                self._queue_seen(seen_marks)
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss")
+            futures = {executor.submit(self._collect_feed, feed_url): feed_url for feed_url in feed_urls}
+            done, not_done = wait(futures, timeout=deadline)
+            
+            for future in done:
+                feed_url = futures[future]
+                results[feed_url], self.feed_timings[feed_url], seen_marks = future.result()
+                self._queue_seen(seen_marks)
+            for future in not_done:
+                logger.warning(f"RSS fetch deadline of {deadline}s reached, skipping: {futures[future]}")
+            
+            # Don't block on stragglers; they are already past the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Assemble in Config.RSS_FEEDS order so output doesn't depend on completion order
         articles = []
+        for feed_url in feed_urls:
+            articles.extend(results.get(feed_url, []))
         
-        for feed_url in self.config.RSS_FEEDS:
-            if not feed_url.strip():
-                continue
+        self._log_feed_timings(time.monotonic() - started)
+        return articles
+    
+    def _collect_feed(self, feed_url: str) -> Tuple[List[Article], float, Dict[str, str]]:
+        """Fetch a single RSS feed, returning its articles, the seconds it took and the seen-marks for its entries
+        
+        The marks are only queued by the caller once it uses the articles, so a feed
+        dropped at the fetch deadline is not marked seen.
+        """
+        articles = []
+        seen_marks = {}
+        started = time.monotonic()
+        
+        try:
+            stored = self._stored_entries(feed_url)
+            if stored is not None:
+                feed_title, entries = stored
+            else:
+                logger.info(f"Fetching RSS feed: {feed_url}")
+                feed_title, entries, not_modified = self.fetch_feed(feed_url)
+                if not_modified:
+                    self.feeds_not_modified.add(feed_url)
+            entries = entries[:self.config.MAX_ARTICLES_PER_SOURCE]
+            
+            if self.seen_store:
+                entries = self._unseen_entries(feed_url, entries)
+                seen_marks = {
+                    SeenEntryStore.entry_key(feed_url, entry): SeenEntryStore.content_hash(entry) for entry in entries
+                }
+            
+            for entry in entries:
+                # Parse publication date
+                pub_date = datetime.now()
+                if entry['published']:
+                    pub_date = datetime(*entry['published'])
                 
+                article = Article(
+                    title=entry['title'],
+                    url=entry['link'],
+                    summary=entry['summary'],
+                    source=feed_title,
+                    published_date=pub_date,
+                    content=entry['summary']
+                )
+                
+                articles.append(article)
+                logger.info(f"Collected article: {article.title}")
+                    
+        except Exception as e:
+            logger.error(f"Error fetching RSS feed {feed_url}: {e}")
+            seen_marks = {}
+        
+        return articles, time.monotonic() - started, seen_marks
+    
+    def _stored_entries(self, feed_url: str) -> Optional[Tuple[str, List[dict]]]:
+        """Read a feed from the poller's article store, or None to fetch it live"""
+        if not self.article_store:
+            return None
+        
+        week_ago = datetime.now() - timedelta(days=7)
+        stored = self.article_store.load_entries(
+            feed_url, week_ago, self.config.MAX_ARTICLES_PER_SOURCE, self.config.POLL_STALE_FACTOR
+        )
+        if stored is not None:
+            logger.info(f"Reading RSS feed from article store: {feed_url}")
+        else:
+            logger.info(f"Article store has no fresh poll of this feed, fetching live: {feed_url}")
+        return stored
+    
+    def _unseen_entries(self, feed_url: str, entries: List[dict]) -> List[dict]:
+        """Drop entries processed in an earlier run"""
+        if self.config.FORCE_FULL_RESCAN:
+            return entries
+        
+        unseen = self.seen_store.filter_unseen(feed_url, entries)
+        if len(unseen) < len(entries):
+            logger.info(f"Skipping {len(entries) - len(unseen)} already processed entries: {feed_url}")
+        return unseen
+    
+    def _queue_seen(self, seen_marks: Dict[str, str]):
+        """Queue the entries of a feed result that this run used, to be marked seen once it succeeds"""
+        with self._pending_seen_lock:
+            self._pending_seen.update(seen_marks)
+    
+    def mark_entries_seen(self):
+        """Persist the feed entries and Twitter watermarks of this run so later runs skip them; call once the edition was sent"""
+        if self.twitter_watermarks:
+            watermarks, self._pending_watermarks = self._pending_watermarks, {}
+            for query, newest_id in watermarks.items():
+                self.twitter_watermarks.set(query, newest_id)
+        
+        if not self.seen_store:
+            return
+        
+        with self._pending_seen_lock:
+            marks, self._pending_seen = self._pending_seen, {}
+        
+        self.seen_store.mark_seen(marks)
+        logger.info(f"Marked {len(marks)} feed entries as seen")
+    
+    def fetch_feed(self, feed_url: str) -> Tuple[str, List[dict], bool]:
+        """Download and parse a feed, reusing cached entries when the server reports 304
+        
+        Returns (feed_title, entries, not_modified). It leaves the collection run's
+        state alone, so the feed poller can call it from its own thread.
+        """
+        headers = {}
+        cached = self.feed_cache.get(feed_url) if self.feed_cache else None
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        response = self.http.get(feed_url, timeout=self.config.RSS_FEED_TIMEOUT, headers=headers)
+        if response is None:
+            raise requests.Timeout(f"Feed download exceeded {self.config.RSS_FEED_TIMEOUT}s")
+        
+        if response.status_code == 304 and cached:
+            logger.info(f"Feed not modified, using cached entries: {feed_url}")
+            return cached['feed_title'], cached['entries'], True
+        
+        response.raise_for_status()
+        
+        feed = feedparser.parse(
+            response.content,
+            response_headers={
+                'content-location': response.url,
+                'content-type': response.headers.get('content-type', '')
+            }
+        )
+        feed_title = feed.feed.title if hasattr(feed.feed, 'title') else 'RSS Feed'
+        entries = self._parse_feed_entries(feed)
+        
+        etag = response.headers.get('etag')
+        last_modified = response.headers.get('last-modified')
+        if self.feed_cache and (etag or last_modified):
+            self.feed_cache.put(feed_url, etag, last_modified, feed_title, entries)
+        
+        return feed_title, entries, False
+    
+    def _parse_feed_entries(self, feed) -> List[dict]:
+        """Convert feedparser entries to plain dicts that can be cached"""
+        entries = []
+        
+        for entry in feed.entries:
             try:
-                logger.info(f"Fetching RSS feed: {feed_url}")
-                feed = feedparser.parse(feed_url)
+                published = None
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    published = list(entry.published_parsed[:6])
+                
+                # Extract content
+                content = ""
+                if hasattr(entry, 'summary'):
+                    content = entry.summary
+                elif hasattr(entry, 'description'):
+                    content = entry.description
+                
+                entries.append({
+                    'id': entry.get('id') or entry.link,
+                    'title': entry.title,
+                    'link': entry.link,
+                    'summary': content,
+                    'published': published
+                })
                 
-                for entry in feed.entries[:self.config.MAX_ARTICLES_PER_SOURCE]:
-                    try:
-                        # Parse publication date
-                        pub_date = datetime.now()
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            pub_date = datetime(*entry.published_parsed[:6])
-                        
-                        # Extract content
-                        content = ""
-                        if hasattr(entry, 'summary'):
-                            content = entry.summary
-                        elif hasattr(entry, 'description'):
-                            content = entry.description
-                        
-                        article = Article(
-                            title=entry.title,
-                            url=entry.link,
-                            summary=content,
-                            source=feed.feed.title if hasattr(feed.feed, 'title') else 'RSS Feed',
-                            published_date=pub_date,
-                            content=content
-                        )
-                        
-                        articles.append(article)
-                        logger.info(f"Collected article: {article.title}")
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing RSS entry: {e}")
-                        
             except Exception as e:
-                logger.error(f"Error fetching RSS feed {feed_url}: {e}")
+                logger.error(f"Error processing RSS entry: {e}")
         
-        return articles
+        return entries
+    
+    def _log_feed_timings(self, total_seconds: float):
+        """Log how long each feed took in the last collection run"""
+        for feed_url, seconds in sorted(self.feed_timings.items(), key=lambda item: item[1], reverse=True):
+            logger.info(f"Feed timing: {seconds:.2f}s {feed_url}")
+        
+        logger.info(
+            f"Fetched {len(self.feed_timings)} RSS feeds in {total_seconds:.2f}s "
+            f"({len(self.feeds_not_modified)} not modified)"
+        )
     
     def collect_twitter_content(self) -> List[Article]:
         """Collect relevant tweets about AI"""
@@ -75,6 +474,9 @@ class ContentCollector:
             logger.warning("Twitter client not configured")
             return articles
         
+        if self.config.TWITTER_BATCHED_SEARCH:
+            return self._collect_twitter_batched()
+        
         try:
             for keyword in self.config.TWITTER_KEYWORDS:
                 if not keyword.strip():
@@ -93,40 +495,273 @@ class ContentCollector:
                     for tweet in tweets.data:
                         # Only include tweets with significant engagement
                         if tweet.public_metrics['like_count'] > 10:
-                            article = Article(
-                                title=f"Twitter: {tweet.text[:100]}...",
-                                url=f"https://twitter.com/i/web/status/{tweet.id}",
-                                summary=tweet.text,
-                                source="Twitter",
-                                published_date=tweet.created_at,
-                                content=tweet.text
-                            )
-                            articles.append(article)
+                            articles.append(self._tweet_to_article(tweet))
                             
         except Exception as e:
             logger.error(f"Error collecting Twitter content: {e}")
         
         return articles
     
+    def _collect_twitter_batched(self) -> List[Article]:
+        """Search all keywords with as few OR queries as possible, only fetching tweets newer than the last poll
+        
+        The engagement filter needs likes, which arrive after a tweet is posted, so each
+        poll also searches the last TWITTER_ENGAGEMENT_WINDOW_HOURS again. Watermarks are
+        queued and only saved by mark_entries_seen() once the edition was sent.
+        """
+        articles = []
+        keywords = list(dict.fromkeys(keyword.strip() for keyword in self.config.TWITTER_KEYWORDS if keyword.strip()))
+        queries = self._build_twitter_queries(keywords)
+        
+        for query in queries:
+            try:
+                since_id = self._twitter_since_id(self._pending_watermarks.get(query) or self.twitter_watermarks.get(query))
+                logger.info(f"Searching Twitter for: {query} (since_id={since_id})")
+                
+                tweets = self._search_tweets(query, since_id)
+                if tweets is None:
+                    continue
+                
+                for tweet in tweets.data or []:
+                    # Only include tweets with significant engagement
+                    if tweet.public_metrics['like_count'] > 10:
+                        articles.append(self._tweet_to_article(tweet))
+                
+                newest_id = (tweets.meta or {}).get('newest_id')
+                if newest_id:
+                    self._pending_watermarks[query] = newest_id
+                    
+            except Exception as e:
+                logger.error(f"Error collecting Twitter content for query {query}: {e}")
+        
+        logger.info(f"Collected {len(articles)} tweets from {len(queries)} searches for {len(keywords)} keywords")
+        return articles
+    
+    def _twitter_since_id(self, watermark: Optional[str]) -> Optional[str]:
+        """The since_id to search from: the watermark, lagged by the engagement window and clamped to the search window"""
+        if watermark is None:
+            return None
+        
+        now = datetime.now()
+        lagged = min(int(watermark), tweet_id_at(now - timedelta(hours=self.config.TWITTER_ENGAGEMENT_WINDOW_HOURS)))
+        return str(max(lagged, tweet_id_at(now - TWITTER_SEARCH_WINDOW)))
+    
+    def _build_twitter_queries(self, keywords: List[str]) -> List[str]:
+        """Pack keywords into OR queries that stay under the API's query length limit"""
+        suffix = " -is:retweet lang:en"
+        
+        def render(terms: List[str]) -> str:
+            if len(terms) == 1:
+                return f"{terms[0]}{suffix}"
+            return f"({' OR '.join(terms)}){suffix}"
+        
+        queries = []
+        group = []
+        for keyword in keywords:
+            term = f'"{keyword}"' if ' ' in keyword else keyword
+            if group and len(render(group + [term])) > self.config.TWITTER_QUERY_MAX_LENGTH:
+                queries.append(render(group))
+                group = []
+            group.append(term)
+        
+        if group:
+            queries.append(render(group))
+        
+        return queries
+    
+    def _search_tweets(self, query: str, since_id: Optional[str]):
+        """Run a recent search, waiting out rate limits instead of failing when the wait is short"""
+        max_wait = self.config.TWITTER_MAX_RATE_LIMIT_WAIT
+        
+        for _ in range(self.config.TWITTER_RATE_LIMIT_RETRIES + 1):
+            # Hold the call until the window reported by an earlier 429 has reset
+            wait_seconds = self._twitter_resume_at - time.time()
+            if wait_seconds > max_wait:
+                logger.warning(f"Twitter rate limited for another {wait_seconds:.0f}s, skipping: {query}")
+                return None
+            if wait_seconds > 0:
+                logger.info(f"Waiting {wait_seconds:.0f}s for the Twitter rate limit window to reset")
+                time.sleep(wait_seconds)
+            
+            try:
+                return self.twitter_client.search_recent_tweets(
+                    query=query,
+                    since_id=since_id,
+                    max_results=self.config.TWITTER_MAX_RESULTS,
+                    tweet_fields=['created_at', 'author_id', 'public_metrics']
+                )
+            except tweepy.TooManyRequests as e:
+                reset_at = int(e.response.headers.get('x-rate-limit-reset', 0) or 0)
+                self._twitter_resume_at = max(reset_at + 1, time.time() + 1)
+                logger.warning(f"Twitter rate limit hit, resuming at {datetime.fromtimestamp(self._twitter_resume_at)}")
+        
+        return None
+    
+    def _tweet_to_article(self, tweet) -> Article:
+        """Convert a tweet into an article"""
+        published_date = tweet.created_at
+        if published_date.tzinfo is not None:
+            # Feed dates are naive local time; keep tweets comparable with them
+            published_date = published_date.astimezone().replace(tzinfo=None)
+        
+        return Article(
+            title=f"Twitter: {tweet.text[:100]}...",
+            url=f"https://twitter.com/i/web/status/{tweet.id}",
+            summary=tweet.text,
+            source="Twitter",
+            published_date=published_date,
+            content=tweet.text
+        )
+    
     def enhance_article_content(self, article: Article) -> Article:
-        """Extract full article content using newspaper3k"""
+        """Extract full article content using the configured extractor"""
         try:
-            news_article = NewspaperArticle(article.url)
-            news_article.download()
-            news_article.parse()
+            if self.extractor.name != "newspaper":
+                # A long enough feed summary already covers what curation reads
+                summary_text = html_to_text(article.summary or '')
+                if len(summary_text) >= self.config.EXTRACT_TARGET_CHARS:
+                    article.content = summary_text
+                    return article
+            
+            if self.article_cache:
+                cached_text = self.article_cache.get(article.url)
+                if cached_text is not None:
+                    article.content = cached_text
+                    return article
             
-            if news_article.text:
-                article.content = news_article.text
+            html = self._download_article_html(article.url)
+            if html is None:
+                return article
+            
+            text = self._extract_text(html, article.url)
+            
+            if text:
+                article.content = text
                 logger.info(f"Enhanced content for: {article.title}")
+                
+                if self.article_cache:
+                    self.article_cache.put(article.url, text)
             
         except Exception as e:
             logger.error(f"Error enhancing article content: {e}")
         
         return article
     
+    def _extract_text(self, html: str, url: str) -> str:
+        """Extract article text, in a worker process when EXTRACT_PROCESSES is set"""
+        if self.config.EXTRACT_PROCESSES <= 0:
+            return self.extractor.extract(html, url)
+        
+        # Parsing is CPU-bound and holds the GIL; only the text comes back from the worker
+        future = self._get_extract_pool().submit(extract_in_worker, html, url)
+        text, parse_seconds = future.result(timeout=self.config.ARTICLE_TIMEOUT)
+        logger.debug(f"Parsed {url} in a worker process in {parse_seconds:.3f}s")
+        return text
+    
+    def _get_extract_pool(self) -> ProcessPoolExecutor:
+        """Start the extraction process pool on first use"""
+        with self._extract_pool_lock:
+            if self._extract_pool is None:
+                self._extract_pool = ProcessPoolExecutor(
+                    max_workers=self.config.EXTRACT_PROCESSES,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=init_worker
+                )
+                logger.info(f"Started {self.config.EXTRACT_PROCESSES} extraction worker processes")
+            return self._extract_pool
+    
+    def enhance_articles(self, articles: List[Article]) -> List[Article]:
+        """Enhance articles in parallel, bounded globally and per host"""
+        workers = min(max(1, self.config.ENHANCE_WORKERS), max(1, len(articles)))
+        started = time.monotonic()
+        if self.article_cache:
+            self.article_cache.reset_stats()
+        
+        if workers == 1:
+            enhanced_articles = [self.enhance_article_content(article) for article in articles]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enhance") as executor:
+                enhanced_articles = list(executor.map(self.enhance_article_content, articles))
+        
+        logger.info(f"Enhanced {len(articles)} articles in {time.monotonic() - started:.2f}s")
+        self._finish_article_cache_run()
+        return enhanced_articles
+    
+    def _finish_article_cache_run(self):
+        """Evict stale cache entries and report this run's hit rate"""
+        if not self.article_cache:
+            return
+        
+        evicted = self.article_cache.evict()
+        logger.info(
+            f"Article cache: {self.article_cache.hits} hits, {self.article_cache.misses} misses, "
+            f"{evicted} evicted"
+        )
+    
+    def _download_article_html(self, url: str) -> Optional[str]:
+        """Download an article page, giving up past the size cap or the per-article timeout"""
+        with self._host_slot(url):
+            response = self.http.get(url, timeout=self.config.ARTICLE_TIMEOUT, max_bytes=self.config.ARTICLE_MAX_BYTES)
+        
+        if response is None:
+            return None
+        
+        response.raise_for_status()
+        return response.text
+    
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Return the semaphore limiting concurrent downloads from the URL's host"""
+        host = urlparse(url).netloc.lower()
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(max(1, self.config.ENHANCE_PER_HOST))
+            return self._host_slots[host]
+    
+    def prefilter_articles(self, articles: List[Article]) -> List[Article]:
+        """Apply the date window, dedup and relevance selection before any full-text download"""
+        week_ago = datetime.now() - timedelta(days=7)
+        seen_keys = set()
+        unique_articles = [
+            article for article in articles
+            if self._is_new_candidate(article, week_ago, seen_keys)
+        ]
+        
+        if self.clusterer:
+            # One article per story, so duplicate coverage doesn't use up candidate slots
+            unique_articles = [cluster.representative for cluster in self.clusterer.cluster(unique_articles)]
+        
+        if self.novelty:
+            # Stories from past editions don't use up candidate slots or full-text downloads either
+            self.novelty.load()  # The curator records sent editions into its own copy of the index
+            unique_articles = self.novelty.filter_new(unique_articles)
+        
+        if self.prerank:
+            candidates = self.prerank.shortlist(unique_articles, self.config.PRERANK_TOP_K)
+        else:
+            candidates = select_candidates(unique_articles)
+        logger.info(
+            f"Prefiltered {len(articles)} articles to {len(candidates)} candidates "
+            f"({len(articles) - len(unique_articles)} stale, duplicate or already featured)"
+        )
+        return candidates
+    
+    def _is_new_candidate(self, article: Article, cutoff: datetime, seen_keys: Set[str]) -> bool:
+        """Check an article is recent and not a repeat by canonical URL or title, recording its keys"""
+        if article.published_date < cutoff:
+            return False
+        
+        url_key = 'url:' + canonical_url(article.url)
+        title_key = 'title:' + ' '.join(article.title.lower().split())
+        if url_key in seen_keys or title_key in seen_keys:
+            return False
+        
+        seen_keys.update((url_key, title_key))
+        return True
+    
     def collect_all_content(self) -> List[Article]:
         """Collect content from all sources"""
         logger.info("Starting content collection...")
+        self.http.reset_stats()
         
         articles = []
         
@@ -138,15 +773,189 @@ class ContentCollector:
         twitter_articles = self.collect_twitter_content()
         articles.extend(twitter_articles)
         
+        if self.config.PREFILTER_BEFORE_ENHANCE:
+            # Only download full text for articles that can still make the newsletter
+            articles = self.prefilter_articles(articles)
+        
         # Enhance articles with full content
-        enhanced_articles = []
-        for article in articles:
-            enhanced_article = self.enhance_article_content(article)
-            enhanced_articles.append(enhanced_article)
+        enhanced_articles = self.enhance_articles(articles)
         
         # Filter articles from the last week
         week_ago = datetime.now() - timedelta(days=7)
         recent_articles = [a for a in enhanced_articles if a.published_date >= week_ago]
         
         logger.info(f"Collected {len(recent_articles)} recent articles")
+        self.http.log_stats()
         return recent_articles
+    
+    def stream_all_content(self) -> Iterator[Article]:
+        """Yield filtered, enhanced articles as soon as each one is ready
+        
+        Feeds are fetched, filtered and enhanced in background threads connected by
+        bounded queues, so a slow consumer pauses collection instead of buffering it.
+        """
+        logger.info("Starting streaming content collection...")
+        self.http.reset_stats()
+        
+        if self.prerank:
+            # A top-K shortlist needs every article first, which a stream never has
+            logger.warning(
+                "PRERANK_ENABLED has no effect with STREAMING_PIPELINE; streamed candidates use the keyword "
+                "relevance filter and every relevant article reaches the LLM"
+            )
+        
+        queue_size = max(1, self.config.STREAM_QUEUE_SIZE)
+        raw_articles = queue.Queue(maxsize=queue_size)
+        ready_articles = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        
+        threading.Thread(
+            target=self._stream_sources, args=(raw_articles, stop), name="stream-sources", daemon=True
+        ).start()
+        threading.Thread(
+            target=self._stream_enhance, args=(raw_articles, ready_articles, stop), name="stream-enhance", daemon=True
+        ).start()
+        
+        try:
+            while True:
+                article = self._stream_get(ready_articles, stop)
+                if article is _STREAM_END:
+                    break
+                yield article
+        finally:
+            # Unblock the background stages if the consumer stops early
+            stop.set()
+    
+    def _stream_sources(self, raw_articles: queue.Queue, stop: threading.Event):
+        """Push articles from each feed as it completes, then from Twitter"""
+        try:
+            feed_urls = [feed_url.strip() for feed_url in self.config.RSS_FEEDS if feed_url.strip()]
+            deadline = self.config.RSS_FETCH_DEADLINE
+            self.feed_timings = {}
+            self.feeds_not_modified = set()
+            started = time.monotonic()
+            
+            if feed_urls:
+                workers = min(max(1, self.config.RSS_FETCH_WORKERS), len(feed_urls))
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss")
+                futures = {executor.submit(self._collect_feed, feed_url): feed_url for feed_url in feed_urls}
+                
+                try:
+                    for future in as_completed(futures, timeout=deadline):
+                        feed_url = futures[future]
+                        articles, self.feed_timings[feed_url], seen_marks = future.result()
+                        self._queue_seen(seen_marks)
+                        for article in articles:
+                            if not self._stream_put(raw_articles, article, stop):
+                                return
+                except FuturesTimeoutError:
+                    for future, feed_url in futures.items():
+                        if not future.done():
+                            logger.warning(f"RSS fetch deadline of {deadline}s reached, skipping: {feed_url}")
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
+            
+            self._log_feed_timings(time.monotonic() - started)
+            
+            for article in self.collect_twitter_content():
+                if not self._stream_put(raw_articles, article, stop):
+                    return
+                    
+        except Exception as e:
+            logger.error(f"Error streaming content sources: {e}")
+        finally:
+            self._stream_put(raw_articles, _STREAM_END, stop)
+    
+    def _stream_enhance(self, raw_articles: queue.Queue, ready_articles: queue.Queue, stop: threading.Event):
+        """Filter incoming articles and enhance candidates on a bounded worker pool"""
+        week_ago = datetime.now() - timedelta(days=7)
+        seen_keys = set()
+        relevant_count = 0
+        filler_articles = []
+        # Near-duplicate coverage of a story already streamed is dropped before enhancement and the LLM
+        stories = StoryIndex(self.clusterer) if self.clusterer else None
+        if self.novelty:
+            self.novelty.load()  # The curator records sent editions into its own copy of the index
+        started = time.monotonic()
+        
+        # Caps articles held by the enhancement stage; released once handed downstream
+        in_flight = threading.BoundedSemaphore(max(1, self.config.STREAM_QUEUE_SIZE))
+        executor = ThreadPoolExecutor(max_workers=max(1, self.config.ENHANCE_WORKERS), thread_name_prefix="enhance")
+        if self.article_cache:
+            self.article_cache.reset_stats()
+        
+        def enhance_and_forward(article: Article):
+            try:
+                self._stream_put(ready_articles, self.enhance_article_content(article), stop)
+            finally:
+                in_flight.release()
+        
+        def submit(article: Article) -> bool:
+            while not in_flight.acquire(timeout=0.5):
+                if stop.is_set():
+                    return False
+            executor.submit(enhance_and_forward, article)
+            return True
+        
+        try:
+            while True:
+                article = self._stream_get(raw_articles, stop)
+                if article is _STREAM_END:
+                    break
+                if not self._is_new_candidate(article, week_ago, seen_keys):
+                    continue
+                if self.novelty and self.novelty.match(article) is not None:
+                    continue
+                if stories and not stories.add(article):
+                    continue
+                
+                if is_relevant(article):
+                    relevant_count += 1
+                    if not submit(article):
+                        return
+                elif len(filler_articles) < MAX_CANDIDATES:
+                    filler_articles.append(article)
+            
+            if stop.is_set():
+                return
+            
+            # Same top-up rule as select_candidates, applied once all sources are in
+            if relevant_count < MIN_RELEVANT_ARTICLES:
+                for article in filler_articles[:max(0, MAX_CANDIDATES - relevant_count)]:
+                    if not submit(article):
+                        return
+            
+            executor.shutdown(wait=True)
+            logger.info(
+                f"Streamed {relevant_count} relevant articles in {time.monotonic() - started:.2f}s"
+                + (f" ({stories.duplicates} near-duplicates dropped)" if stories else "")
+            )
+            self._finish_article_cache_run()
+            self.http.log_stats()
+            
+        except Exception as e:
+            logger.error(f"Error in streaming enhancement: {e}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._stream_put(ready_articles, _STREAM_END, stop)
+    
+    @staticmethod
+    def _stream_put(target: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put into a bounded queue, waiting for room unless the stream was stopped"""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    @staticmethod
+    def _stream_get(source: queue.Queue, stop: threading.Event):
+        """Get from a queue, returning the end marker if the stream was stopped"""
+        while not stop.is_set():
+            try:
+                return source.get(timeout=0.5)
+            except queue.Empty:
+                continue
+        return _STREAM_END
@@ -0,0 +1,139 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Tuple
+from lxml import etree, html as lxml_html
+from loguru import logger
+from config import Config
+
+
+def html_to_text(fragment: str) -> str:
+    """Strip markup from an HTML snippet such as a feed summary"""
+    if '<' not in fragment:
+        return ' '.join(fragment.split())
+    try:
+        return ' '.join(lxml_html.fromstring(fragment).text_content().split())
+    except (etree.ParserError, ValueError):
+        return ' '.join(fragment.split())
+
+
+class ContentExtractor(ABC):
+    """Turns a downloaded article page into plain text"""
+
+    name = "base"
+
+    @abstractmethod
+    def extract(self, html: str, url: str) -> str:
+        """Plain text of the article in `html`"""
+
+
+class LxmlExtractor(ContentExtractor):
+    """Fast main-content heuristic: collects body paragraphs and stops parsing once it has enough text"""
+
+    name = "lxml"
+
+    # Paragraphs inside these are page chrome, not article text
+    SKIP_TAGS = {'script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form',
+                 'button', 'figure', 'figcaption', 'svg', 'iframe', 'template'}
+
+    def __init__(self, target_chars: int, min_paragraph_chars: int = 40, chunk_size: int = 16 * 1024):
+        self.target_chars = target_chars
+        self.min_paragraph_chars = min_paragraph_chars
+        self.chunk_size = chunk_size
+
+    def extract(self, html: str, url: str) -> str:
+        parser = etree.HTMLPullParser(events=('start', 'end'))
+        paragraphs = []
+        total_chars = 0
+        skip_depth = 0
+
+        # Feed the page in chunks so parsing stops as soon as we have enough text
+        for offset in range(0, len(html), self.chunk_size):
+            parser.feed(html[offset:offset + self.chunk_size])
+
+            for event, element in parser.read_events():
+                if not isinstance(element.tag, str):
+                    continue  # comments and processing instructions
+                tag = element.tag.lower()
+
+                if tag in self.SKIP_TAGS:
+                    skip_depth += 1 if event == 'start' else -1
+                elif event == 'end' and tag == 'p' and skip_depth == 0:
+                    text = ' '.join(''.join(element.itertext()).split())
+                    if len(text) >= self.min_paragraph_chars:
+                        paragraphs.append(text)
+                        total_chars += len(text)
+                        if total_chars >= self.target_chars:
+                            return '\n\n'.join(paragraphs)
+
+        parser.close()
+        return '\n\n'.join(paragraphs)
+
+
+class NewspaperExtractor(ContentExtractor):
+    """Full newspaper3k extraction; slower but handles unusual page layouts"""
+
+    name = "newspaper"
+
+    def extract(self, html: str, url: str) -> str:
+        # newspaper3k is slow to import, so only pay for it when this extractor runs
+        from newspaper import Article as NewspaperArticle
+
+        news_article = NewspaperArticle(url)
+        news_article.download(input_html=html)
+        news_article.parse()
+        return news_article.text or ''
+
+
+class FallbackExtractor(ContentExtractor):
+    """Tries a fast extractor first and falls back when it finds too little text"""
+
+    def __init__(self, primary: ContentExtractor, fallback: ContentExtractor, min_chars: int):
+        self.primary = primary
+        self.fallback = fallback
+        self.min_chars = min_chars
+        self.name = f"{primary.name}+{fallback.name}"
+
+    def extract(self, html: str, url: str) -> str:
+        try:
+            text = self.primary.extract(html, url)
+            if len(text) >= self.min_chars:
+                return text
+        except Exception as e:
+            logger.warning(f"{self.primary.name} extractor failed for {url}: {e}")
+
+        return self.fallback.extract(html, url)
+
+
+def build_extractor(config: Config) -> ContentExtractor:
+    """Create the extractor selected by CONTENT_EXTRACTOR"""
+    name = config.CONTENT_EXTRACTOR.lower()
+
+    if name == "newspaper":
+        return NewspaperExtractor()
+    if name == "lxml":
+        return LxmlExtractor(target_chars=config.EXTRACT_TARGET_CHARS)
+    if name != "fast":
+        logger.warning(f"Unknown CONTENT_EXTRACTOR '{config.CONTENT_EXTRACTOR}', using 'fast'")
+
+    return FallbackExtractor(
+        LxmlExtractor(target_chars=config.EXTRACT_TARGET_CHARS),
+        NewspaperExtractor(),
+        min_chars=config.EXTRACT_MIN_CHARS
+    )
+
+
+# Extractor owned by each process-pool worker, built once by init_worker
+_worker_extractor = None
+
+
+def init_worker():
+    """Process pool initializer: build the configured extractor once per worker"""
+    global _worker_extractor
+    _worker_extractor = build_extractor(Config())
+
+
+def extract_in_worker(html: str, url: str) -> Tuple[str, float]:
+    """Run extraction inside a pool worker, returning only the text and the parse time"""
+    started = time.perf_counter()
+    text = _worker_extractor.extract(html, url)
+    return text, time.perf_counter() - started
@@ -0,0 +1,113 @@
+import heapq
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Optional, Tuple
+from loguru import logger
+from config import Config
+from content_collector import ContentCollector
+
+
+class FeedPoller:
+    """Polls each RSS feed at a cadence learned from how often it publishes
+
+    Entries land in the collector's ArticleStore, so the scheduled edition reads
+    a warm local store instead of crawling every feed at send time.
+    """
+
+    def __init__(self, collector: ContentCollector):
+        self.config = Config()
+        self.collector = collector
+        self.store = collector.article_store
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def estimate_publish_interval(self, entries: List[dict]) -> Optional[float]:
+        """Median gap in seconds between consecutive entry timestamps, if there are enough of them"""
+        timestamps = sorted(datetime(*entry['published']).timestamp() for entry in entries if entry['published'])
+        gaps = [later - earlier for earlier, later in zip(timestamps, timestamps[1:]) if later > earlier]
+        return statistics.median(gaps) if gaps else None
+
+    def next_interval(self, previous: Optional[float], entries: List[dict]) -> float:
+        """Blend the observed publish interval into the previous polling interval"""
+        observed = self.estimate_publish_interval(entries)
+
+        if observed is None:
+            interval = previous or self.config.POLL_MAX_INTERVAL
+        else:
+            target = observed * self.config.POLL_INTERVAL_FACTOR
+            interval = target if previous is None else (previous + target) / 2
+
+        return min(self.config.POLL_MAX_INTERVAL, max(self.config.POLL_MIN_INTERVAL, interval))
+
+    def poll_feed(self, feed_url: str, previous_interval: Optional[float]) -> Tuple[float, float]:
+        """Fetch one feed into the store, returning its new interval and next due time"""
+        started = time.time()
+        polled_at = None
+        interval = previous_interval or self.config.POLL_MAX_INTERVAL
+
+        try:
+            feed_title, entries, _ = self.collector.fetch_feed(feed_url)
+            self.store.save_entries(feed_url, feed_title, entries)
+            polled_at = started
+            interval = self.next_interval(previous_interval, entries)
+            logger.info(f"Polled {feed_url}: {len(entries)} entries, next poll in {interval / 60:.0f} min")
+        except Exception as e:
+            # Not counted as a poll, so editions fetch this feed live once its stored entries go stale
+            logger.error(f"Error polling feed {feed_url}: {e}")
+
+        # Jitter keeps feeds with similar intervals from being polled in lockstep
+        jitter = random.uniform(-self.config.POLL_JITTER, self.config.POLL_JITTER)
+        next_poll_at = started + interval * (1 + jitter)
+        self.store.save_poll_state(feed_url, interval, next_poll_at, polled_at)
+
+        return interval, next_poll_at
+
+    def run(self):
+        """Poll feeds as they come due until stopped"""
+        feed_urls = [feed_url.strip() for feed_url in self.config.RSS_FEEDS if feed_url.strip()]
+        state = self.store.load_poll_state()
+
+        # Learned intervals survive restarts; feeds never polled are due immediately
+        intervals = {feed_url: state.get(feed_url, (None, 0.0))[0] for feed_url in feed_urls}
+        due_queue = [(state.get(feed_url, (None, 0.0))[1], feed_url) for feed_url in feed_urls]
+        heapq.heapify(due_queue)
+        last_compaction = 0.0
+
+        logger.info(f"Feed poller started for {len(feed_urls)} feeds")
+
+        with ThreadPoolExecutor(max_workers=max(1, self.config.RSS_FETCH_WORKERS), thread_name_prefix="poll") as executor:
+            while not self._stop.is_set():
+                now = time.time()
+                due = []
+                while due_queue and due_queue[0][0] <= now:
+                    due.append(heapq.heappop(due_queue)[1])
+
+                futures = {executor.submit(self.poll_feed, feed_url, intervals[feed_url]): feed_url for feed_url in due}
+                for future, feed_url in futures.items():
+                    intervals[feed_url], next_poll_at = future.result()
+                    heapq.heappush(due_queue, (next_poll_at, feed_url))
+
+                if now - last_compaction > 3600:
+                    removed = self.store.compact(self.config.ARTICLE_STORE_RETENTION_DAYS)
+                    if removed:
+                        logger.info(f"Compacted article store: removed {removed} old entries")
+                    last_compaction = now
+
+                # Sleep until the next feed is due, waking at least once a minute
+                wait_seconds = due_queue[0][0] - time.time() if due_queue else 60
+                self._stop.wait(min(60, max(1, wait_seconds)))
+
+        logger.info("Feed poller stopped")
+
+    def start(self):
+        """Run the poller in a background thread"""
+        self._thread = threading.Thread(target=self.run, name="feed-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the poller to stop after the current round"""
+        self._stop.set()
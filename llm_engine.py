@@ -0,0 +1,216 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+import openai
+from loguru import logger
+from config import Config
+from prompt_budget import TokenBudget
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at `per_minute` units per minute"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.tokens = per_minute
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float):
+        """Wait until `amount` units are available and take them"""
+        amount = min(amount, self.capacity)  # A single oversized request must still get through
+
+        # Holding the lock while sleeping keeps waiters first-come, first-served
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+    def adjust(self, amount: float):
+        """Charge (or refund, if negative) the difference between an estimate and actual use"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the LLM while the circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """Stops calling a failing LLM after `threshold` consecutive failures
+
+    While open, calls fail immediately so curation goes straight to its heuristic
+    fallbacks. After `cooldown` seconds one probe call is let through (half-open):
+    success closes the breaker, failure opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Close the breaker and clear its metrics for a new run"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self.opened_at = 0.0
+            self.times_opened = 0
+            self.short_circuited = 0
+            self._probe_in_flight = False
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may go ahead now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                logger.info("LLM circuit breaker half-open; probing with the next call")
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self.short_circuited += 1
+        raise CircuitOpenError("LLM circuit breaker is open")
+
+    def allows_call(self) -> bool:
+        """Whether a call could go ahead now, without reserving the probe; a refused call counts as short-circuited"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at < self.cooldown:
+                self.short_circuited += 1
+                return False
+            # Cooldown over or half-open: the next call may be the probe
+            return not self._probe_in_flight
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("LLM circuit breaker closed; probe call succeeded")
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.consecutive_failures >= self.threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+                logger.warning(
+                    f"LLM circuit breaker open after {self.consecutive_failures} consecutive failures; "
+                    f"using fallbacks for {self.cooldown:.0f}s"
+                )
+
+
+class AsyncLLMEngine:
+    """Runs chat completions concurrently on a background event loop under RPM and TPM budgets
+
+    Synchronous callers hand requests over with chat_sync; every request shares the
+    same concurrency limit, rate buckets and 429 back-off.
+    """
+
+    def __init__(self, config: Config, budget: Optional[TokenBudget] = None):
+        self.config = config
+        self.budget = budget
+        self.client = openai.AsyncOpenAI(
+            api_key=config.OPENAI_API_KEY,
+            base_url=config.OPENAI_BASE_URL,
+            timeout=config.LLM_TIMEOUT,
+            max_retries=0  # Retries are scheduled here so 429s pause every request, not just one
+        )
+        self.request_bucket = TokenBucket(config.LLM_REQUESTS_PER_MINUTE) if config.LLM_REQUESTS_PER_MINUTE > 0 else None
+        self.token_bucket = TokenBucket(config.LLM_TOKENS_PER_MINUTE) if config.LLM_TOKENS_PER_MINUTE > 0 else None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._resume_at = 0.0
+        self.rate_limited = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-engine", daemon=True)
+        self._thread.start()
+
+    def estimate_tokens(self, messages: list, max_tokens: int) -> int:
+        """Token cost of a request: its prompt tokens plus the completion budget"""
+        if self.budget:
+            return sum(self.budget.count(message["content"]) for message in messages) + max_tokens
+        return sum(len(message["content"]) for message in messages) // 4 + max_tokens
+
+    def _retry_after(self, error: openai.APIStatusError, attempt: int) -> float:
+        """Seconds to wait after a 429, from the response headers or exponential back-off"""
+        headers = error.response.headers
+        try:
+            if headers.get("retry-after-ms"):
+                return float(headers["retry-after-ms"]) / 1000
+            if headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except ValueError:
+            pass  # HTTP-date form; fall through to back-off
+        return self.config.HTTP_RETRY_BACKOFF * 2 ** attempt
+
+    async def chat(self, **request):
+        """Send one chat completion, waiting for rate budget and retrying 429s, 5xx and connection errors"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, self.config.LLM_CONCURRENCY))
+
+        estimate = self.estimate_tokens(request["messages"], request.get("max_tokens", 0))
+
+        async with self._semaphore:
+            for attempt in range(self.config.LLM_MAX_RETRIES + 1):
+                # A 429 on any request pauses all of them until the server's retry time
+                while time.monotonic() < self._resume_at:
+                    await asyncio.sleep(self._resume_at - time.monotonic())
+
+                if self.request_bucket:
+                    await self.request_bucket.acquire(1)
+                if self.token_bucket:
+                    await self.token_bucket.acquire(estimate)
+
+                try:
+                    response = await self.client.chat.completions.create(**request)
+                except openai.RateLimitError as e:
+                    self.rate_limited += 1
+                    wait = self._retry_after(e, attempt)
+                    if attempt == self.config.LLM_MAX_RETRIES or wait > self.config.LLM_MAX_RETRY_WAIT:
+                        raise
+                    logger.warning(f"LLM rate limited; retrying in {wait:.1f}s")
+                    self._resume_at = max(self._resume_at, time.monotonic() + wait)
+                    continue
+                except (openai.APIConnectionError, openai.InternalServerError) as e:
+                    # The SDK's own retries are off, so these are retried here; only this request backs off
+                    if attempt == self.config.LLM_MAX_RETRIES:
+                        raise
+                    wait = self.config.HTTP_RETRY_BACKOFF * 2 ** attempt
+                    logger.warning(f"LLM request failed ({e.__class__.__name__}); retrying in {wait:.1f}s")
+                    await asyncio.sleep(wait)
+                    continue
+
+                if self.token_bucket and response.usage:
+                    self.token_bucket.adjust(response.usage.total_tokens - estimate)
+                return response
+
+    def chat_sync(self, **request):
+        """Run chat on the engine's loop from a worker thread and wait for the response"""
+        return asyncio.run_coroutine_threadsafe(self.chat(**request), self._loop).result()
+
+    def close(self):
+        """Close the HTTP client and stop the background loop"""
+        asyncio.run_coroutine_threadsafe(self.client.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
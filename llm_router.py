@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Optional
+import anthropic
+import numpy as np
+import openai
+from loguru import logger
+from config import Config
+from llm_engine import AsyncLLMEngine
+
+PROVIDERS = ("openai", "anthropic")
+
+
+@dataclass
+class ChatResult:
+    """A completion from either provider, in one shape"""
+    content: str
+    model: str
+    provider: str
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+
+    @classmethod
+    def from_openai(cls, response) -> "ChatResult":
+        usage = response.usage
+        return cls(
+            content=response.choices[0].message.content,
+            model=response.model,
+            provider="openai",
+            prompt_tokens=usage.prompt_tokens if usage else None,
+            completion_tokens=usage.completion_tokens if usage else None
+        )
+
+
+class ProviderRouter:
+    """Routes chat requests between OpenAI and Anthropic, optionally hedging slow ones
+
+    LLM_ROUTING picks the policy: 'openai' or 'anthropic' sends everything to that
+    provider; 'hedged' sends to LLM_PRIMARY_PROVIDER and, once the request has run
+    past the primary's LLM_HEDGE_PERCENTILE latency, sends the same request to the
+    other provider, keeps whichever answer arrives first and cancels the other.
+    A primary that fails outright is also retried on the other provider.
+    """
+
+    def __init__(self, config: Config, engine: Optional[AsyncLLMEngine] = None):
+        self.config = config
+        self.engine = engine
+        self.policy = config.LLM_ROUTING
+        self.primary = config.LLM_PRIMARY_PROVIDER if self.policy == "hedged" else self.policy
+        self.secondary = next(provider for provider in PROVIDERS if provider != self.primary)
+
+        # OpenAI requests go through the async engine when there is one, keeping its rate limits
+        self.openai_client = None if engine else openai.AsyncOpenAI(
+            api_key=config.OPENAI_API_KEY,
+            base_url=config.OPENAI_BASE_URL,
+            timeout=config.LLM_TIMEOUT
+        )
+        self.anthropic_client = anthropic.AsyncAnthropic(
+            api_key=config.ANTHROPIC_API_KEY,
+            base_url=config.ANTHROPIC_BASE_URL,
+            timeout=config.LLM_TIMEOUT
+        ) if config.ANTHROPIC_API_KEY else None
+
+        if not self._available(self.primary):
+            logger.warning(f"LLM routing prefers {self.primary} but ANTHROPIC_API_KEY is not set; routing to openai")
+            self.primary, self.secondary = "openai", "anthropic"
+            if self.policy == "anthropic":
+                self.policy = "openai"
+        elif self.policy == "hedged" and not self._available(self.secondary):
+            logger.warning(f"No {self.secondary} credentials; hedged routing will only use {self.primary}")
+
+        self.latencies: Dict[str, deque] = {provider: deque(maxlen=200) for provider in PROVIDERS}
+        self.hedges = 0
+        self.wins = {provider: 0 for provider in PROVIDERS}
+
+        if engine:
+            self._loop = engine._loop
+        else:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name="llm-router", daemon=True).start()
+
+    def _available(self, provider: str) -> bool:
+        return provider == "openai" or self.anthropic_client is not None
+
+    def reset_stats(self):
+        """Start counting hedges and wins for a new run; latency history is kept"""
+        self.hedges = 0
+        self.wins = {provider: 0 for provider in PROVIDERS}
+
+    def hedge_delay(self) -> float:
+        """How long the primary gets before the hedge request is sent"""
+        history = self.latencies[self.primary]
+        if len(history) < self.config.LLM_HEDGE_MIN_SAMPLES:
+            return self.config.LLM_HEDGE_DELAY
+        return float(np.percentile(history, self.config.LLM_HEDGE_PERCENTILE))
+
+    async def _call(self, provider: str, request: dict) -> ChatResult:
+        """Send a request to one provider, recording its latency on success"""
+        started = time.monotonic()
+
+        if provider == "openai":
+            if self.engine:
+                response = await self.engine.chat(**request)
+            else:
+                response = await self.openai_client.chat.completions.create(**request)
+            result = ChatResult.from_openai(response)
+        else:
+            # Anthropic has no JSON mode flag; the curation prompts already ask for JSON only
+            response = await self.anthropic_client.messages.create(
+                model=self.config.ANTHROPIC_MODEL,
+                messages=request["messages"],
+                max_tokens=request["max_tokens"],
+                # Sent as a raw body field, since not every SDK version takes it as an argument
+                extra_body={"temperature": request["temperature"]}
+            )
+            result = ChatResult(
+                content="".join(block.text for block in response.content if block.type == "text"),
+                model=response.model,
+                provider="anthropic",
+                prompt_tokens=response.usage.input_tokens,
+                completion_tokens=response.usage.output_tokens
+            )
+
+        self.latencies[provider].append(time.monotonic() - started)
+        return result
+
+    async def chat(self, **request) -> ChatResult:
+        """Route one request according to the policy"""
+        started = time.monotonic()
+        primary_task = asyncio.ensure_future(self._call(self.primary, request))
+        if self.policy != "hedged" or not self._available(self.secondary):
+            result = await primary_task
+            self.wins[result.provider] += 1
+            return result
+
+        done, _ = await asyncio.wait({primary_task}, timeout=self.hedge_delay())
+        if done and primary_task.exception() is None:
+            self.wins[self.primary] += 1
+            return primary_task.result()
+
+        self.hedges += 1
+        pending = {asyncio.ensure_future(self._call(self.secondary, request))}
+        if not done:
+            pending.add(primary_task)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    if primary_task in pending:
+                        # The primary took at least this long; dropping it would censor the slow tail
+                        self.latencies[self.primary].append(time.monotonic() - started)
+                    result = task.result()
+                    self.wins[result.provider] += 1
+                    return result
+
+        # Both providers failed; report the primary's error
+        raise primary_task.exception()
+
+    def chat_sync(self, **request) -> ChatResult:
+        """Run chat on the router's loop from a worker thread and wait for the result"""
+        return asyncio.run_coroutine_threadsafe(self.chat(**request), self._loop).result()
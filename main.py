@@ -12,6 +12,7 @@ from config import Config
 from content_collector import ContentCollector
 from ai_curator import AIContentCurator
 from newsletter_generator import NewsletterGenerator
+from feed_poller import FeedPoller
 
 class NewsletterScheduler:
     """Schedules and manages newsletter generation"""
@@ -21,6 +22,7 @@ class NewsletterScheduler:
         self.content_collector = ContentCollector()
         self.ai_curator = AIContentCurator()
         self.newsletter_generator = NewsletterGenerator()
+        self.feed_poller = FeedPoller(self.content_collector) if self.config.FEED_POLLING else None
         
         # Setup logging
         logger.add("newsletter.log", rotation="1 week", retention="4 weeks")
@@ -33,21 +35,35 @@ class NewsletterScheduler:
             # Validate configuration
             self.config.validate_config()
             
-            # Step 1: Collect content from all sources
-            logger.info("Collecting content...")
-            articles = self.content_collector.collect_all_content()
+            # One LLM usage report for the whole edition, intro included
+            self.ai_curator.start_llm_run()
             
-            if not articles:
-                logger.warning("No articles collected. Skipping newsletter generation.")
-                return
+            if self.config.STREAMING_PIPELINE:
+                # Steps 1-2 overlapped: curation scores articles as collection yields them
+                logger.info("Collecting and curating content as a stream...")
+                curated_articles = self.ai_curator.curate_stream(self.content_collector.stream_all_content())
+            else:
+                # Step 1: Collect content from all sources
+                logger.info("Collecting content...")
+                articles = self.content_collector.collect_all_content()
+                
+                if not articles:
+                    logger.warning("No articles collected. Skipping newsletter generation.")
+                    return
+                
+                # Step 2: Use AI to curate and enhance content
+                logger.info("Curating content with AI...")
+                curated_articles = self.ai_curator.curate_articles(articles)
             
-            # Step 2: Use AI to curate and enhance content
-            logger.info("Curating content with AI...")
-            curated_articles = self.ai_curator.curate_articles(articles)
+            if not curated_articles:
+                logger.warning("No articles curated. Skipping newsletter generation.")
+                self.ai_curator.finish_llm_run()
+                return
             
             # Step 3: Generate newsletter intro and outro
             intro = self.ai_curator.generate_newsletter_intro(curated_articles)
             outro = self.ai_curator.generate_newsletter_outro()
+            self.ai_curator.finish_llm_run()
             
             # Step 4: Generate newsletter
             newsletter = self.newsletter_generator.generate_newsletter_content(
@@ -61,7 +77,11 @@ class NewsletterScheduler:
             logger.info(f"Newsletter saved locally: {saved_file}")
             
             # Step 6: Send newsletter
-            if self.newsletter_generator.send_newsletter(newsletter):                logger.info("Newsletter sent successfully!")
+            if self.newsletter_generator.send_newsletter(newsletter):
+                logger.info("Newsletter sent successfully!")
+                # Only a sent edition counts as seen and featured, so a failed send can be retried unchanged
+                self.content_collector.mark_entries_seen()
+                self.ai_curator.record_featured(curated_articles)
             else:
                 logger.error("Failed to send newsletter")
             
@@ -88,6 +108,10 @@ class NewsletterScheduler:
             schedule_func = getattr(schedule.every(), schedule_day)
             schedule_func.at(schedule_time).do(self.generate_and_send_newsletter)
         
+        if self.feed_poller:
+            # Keep the article store warm so the edition doesn't crawl at send time
+            self.feed_poller.start()
+        
         logger.info("Scheduler started. Press Ctrl+C to stop.")
         
         try:
@@ -95,13 +119,19 @@ class NewsletterScheduler:
                 schedule.run_pending()
                 time.sleep(60)  # Check every minute
         except KeyboardInterrupt:
+            if self.feed_poller:
+                self.feed_poller.stop()
             logger.info("Scheduler stopped by user")
 
 def main():
     """Main entry point"""
+    if "--full-rescan" in sys.argv:
+        # Ignore the seen-entry store and reprocess every feed entry
+        Config.FORCE_FULL_RESCAN = True
+    
     scheduler = NewsletterScheduler()
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--run-once":
+    if "--run-once" in sys.argv[1:]:
         # Run once for testing
         scheduler.run_once()
     else:
@@ -0,0 +1,199 @@
+import hashlib
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import numpy as np
+from loguru import logger
+from clustering import StoryClusterer
+from config import Config
+from content_cache import canonical_url
+from models import Article
+
+
+class NoveltyIndex:
+    """Fingerprints of articles featured in past editions, so repeats are dropped before scoring
+
+    Each featured article is indexed by its canonical URL, its normalized title and
+    the LSH band keys of its MinHash signature. All fingerprints are loaded into
+    memory once, so checking a candidate is a handful of hash lookups; band hits
+    are confirmed against the stored signature before counting as a repeat.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config()
+        self.db_path = self.config.CONTENT_CACHE_DB
+        self.clusterer = StoryClusterer(self.config)
+        self._exact: Dict[str, int] = {}
+        self._bands: Dict[str, List[int]] = {}
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._titles: Dict[int, str] = {}
+        self._init_database()
+        self.load()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the featured article and fingerprint tables if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS featured_articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                title TEXT NOT NULL,
+                signature BLOB,
+                featured_at TEXT NOT NULL
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS featured_fingerprints (
+                fingerprint TEXT NOT NULL,
+                article_id INTEGER NOT NULL REFERENCES featured_articles(id)
+            )
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS featured_fingerprints_key ON featured_fingerprints (fingerprint)')
+        conn.execute('CREATE INDEX IF NOT EXISTS featured_fingerprints_article ON featured_fingerprints (article_id)')
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _hash(kind: str, value: str) -> str:
+        return f"{kind}:" + hashlib.sha256(value.encode('utf-8')).hexdigest()[:32]
+
+    def _signature(self, article: Article) -> Optional[np.ndarray]:
+        shingle_hashes = self.clusterer.shingles(article)
+        return self.clusterer.signature(shingle_hashes) if len(shingle_hashes) else None
+
+    def _exact_fingerprints(self, article: Article) -> List[str]:
+        return [
+            self._hash('url', canonical_url(article.url)),
+            self._hash('title', ' '.join(article.title.lower().split()))
+        ]
+
+    def _band_fingerprints(self, signature: Optional[np.ndarray]) -> List[str]:
+        if signature is None:
+            return []
+        rows = self.clusterer.rows
+        return [
+            f"band{band}:" + hashlib.sha256(signature[band * rows:(band + 1) * rows].tobytes()).hexdigest()[:32]
+            for band in range(self.clusterer.bands)
+        ]
+
+    def load(self):
+        """Load every stored fingerprint into memory"""
+        self._exact.clear()
+        self._bands.clear()
+        self._signatures.clear()
+        self._titles.clear()
+
+        try:
+            conn = self._connect()
+            for article_id, title, signature in conn.execute('SELECT id, title, signature FROM featured_articles'):
+                self._titles[article_id] = title
+                if signature is not None:
+                    self._signatures[article_id] = np.frombuffer(signature, dtype=np.uint64)
+            for fingerprint, article_id in conn.execute('SELECT fingerprint, article_id FROM featured_fingerprints'):
+                if fingerprint.startswith('band'):
+                    self._bands.setdefault(fingerprint, []).append(article_id)
+                else:
+                    self._exact[fingerprint] = article_id
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading novelty index: {e}")
+
+    def match(self, article: Article) -> Optional[str]:
+        """Title of the past featured article this one repeats, if any"""
+        for fingerprint in self._exact_fingerprints(article):
+            if fingerprint in self._exact:
+                return self._titles.get(self._exact[fingerprint])
+
+        signature = self._signature(article)
+        for fingerprint in self._band_fingerprints(signature):
+            for article_id in self._bands.get(fingerprint, ()):
+                stored = self._signatures.get(article_id)
+                if stored is not None and np.mean(stored == signature) >= self.clusterer.threshold:
+                    return self._titles.get(article_id)
+
+        return None
+
+    def filter_new(self, articles: List[Article]) -> List[Article]:
+        """Drop articles that repeat a story from a past edition"""
+        new_articles = []
+        for article in articles:
+            repeated = self.match(article)
+            if repeated is None:
+                new_articles.append(article)
+            else:
+                logger.debug(f"Skipping already featured story: {article.title} (was: {repeated})")
+
+        if len(new_articles) < len(articles):
+            logger.info(f"Novelty index dropped {len(articles) - len(new_articles)} already featured stories")
+        return new_articles
+
+    def record(self, articles: List[Article]):
+        """Index the articles of an edition that went out, then compact old entries"""
+        now = datetime.now().isoformat()
+        recorded_urls = set()
+
+        try:
+            conn = self._connect()
+            for article in articles:
+                # Padding copies of an article share its URL; index each story once
+                url_key = canonical_url(article.url)
+                if url_key in recorded_urls:
+                    continue
+                recorded_urls.add(url_key)
+
+                signature = self._signature(article)
+                article_id = conn.execute(
+                    'INSERT INTO featured_articles (url, title, signature, featured_at) VALUES (?, ?, ?, ?)',
+                    (article.url, article.title, signature.tobytes() if signature is not None else None, now)
+                ).lastrowid
+                conn.executemany(
+                    'INSERT INTO featured_fingerprints (fingerprint, article_id) VALUES (?, ?)',
+                    [(fingerprint, article_id)
+                     for fingerprint in self._exact_fingerprints(article) + self._band_fingerprints(signature)]
+                )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error recording featured articles: {e}")
+
+        removed = self.compact(self.config.NOVELTY_RETENTION_DAYS)
+        logger.info(f"Novelty index: recorded {len(recorded_urls)} featured stories, removed {removed} expired")
+        self.load()
+
+    def featured_since(self, since: datetime) -> List[dict]:
+        """Articles featured since a given time, newest first"""
+        try:
+            conn = self._connect()
+            rows = conn.execute(
+                'SELECT url, title, featured_at FROM featured_articles WHERE featured_at >= ? ORDER BY featured_at DESC',
+                (since.isoformat(),)
+            ).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error querying novelty index: {e}")
+            return []
+
+        return [{'url': url, 'title': title, 'featured_at': datetime.fromisoformat(featured_at)}
+                for url, title, featured_at in rows]
+
+    def compact(self, max_age_days: float) -> int:
+        """Forget articles featured more than `max_age_days` ago"""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+
+        try:
+            conn = self._connect()
+            conn.execute(
+                'DELETE FROM featured_fingerprints WHERE article_id IN '
+                '(SELECT id FROM featured_articles WHERE featured_at < ?)', (cutoff,)
+            )
+            removed = conn.execute('DELETE FROM featured_articles WHERE featured_at < ?', (cutoff,)).rowcount
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error compacting novelty index: {e}")
+            return 0
+
+        return removed
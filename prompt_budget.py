@@ -0,0 +1,43 @@
+from loguru import logger
+try:
+    import tiktoken
+except ImportError:  # Exact token counts are optional
+    tiktoken = None
+
+# Rough characters per token for English text, used when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+
+class TokenBudget:
+    """Counts and truncates prompt text in model tokens
+
+    Uses the model's tiktoken encoding when it can be loaded, otherwise a
+    characters-per-token estimate, so budgets still hold approximately.
+    """
+
+    def __init__(self, model: str):
+        self.encoding = None
+        if tiktoken is None:
+            return
+
+        try:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # Encodings are downloaded on first use, which fails offline
+            logger.warning(f"Could not load a tokenizer for {model}; estimating tokens from length: {e}")
+
+    def count(self, text: str) -> int:
+        """Number of tokens in `text`"""
+        if self.encoding:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return -(-len(text) // CHARS_PER_TOKEN)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """`text` cut to at most `max_tokens` tokens"""
+        if self.encoding:
+            tokens = self.encoding.encode(text, disallowed_special=())
+            return text if len(tokens) <= max_tokens else self.encoding.decode(tokens[:max_tokens])
+        return text[:max_tokens * CHARS_PER_TOKEN]
@@ -0,0 +1,124 @@
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from loguru import logger
+from config import Config
+from models import Article
+from relevance import AI_KEYWORDS
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Every word of the keyword list is a term of the topic query
+TOPIC_TERMS = sorted({word for keyword in AI_KEYWORDS for word in keyword.rstrip('*').split()})
+
+# Keeps articles with no topic terms ordered by recency and source instead of tied at zero
+BASE_RELEVANCE = 0.01
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_source_priors(entries: List[str]) -> Dict[str, float]:
+    """Parse 'Source Name=weight' entries; malformed ones are skipped with a warning"""
+    priors = {}
+    for entry in entries:
+        if not entry.strip():
+            continue
+        name, _, weight = entry.rpartition('=')
+        try:
+            priors[name.strip().lower()] = float(weight)
+        except ValueError:
+            logger.warning(f"Ignoring malformed SOURCE_PRIORS entry: {entry}")
+    return priors
+
+
+class PreRanker:
+    """Ranks every collected article locally so only the best few reach the LLM
+
+    Score = topic relevance x recency decay x source prior, where relevance is the
+    cosine between each article's TF-IDF vector (title weighted over summary) and
+    the keyword topic vector, computed in one pass over a CSR term matrix.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config()
+        self.source_priors = parse_source_priors(self.config.SOURCE_PRIORS)
+
+    def _term_matrix(self, articles: List[Article]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, int]]:
+        """Build the CSR term-count matrix (indptr, indices, counts) and its vocabulary"""
+        vocabulary: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        counts: List[float] = []
+        title_weight = self.config.PRERANK_TITLE_WEIGHT
+
+        for article in articles:
+            terms = Counter(tokenize(article.summary))
+            for term in tokenize(article.title):
+                terms[term] += title_weight
+            for term, count in terms.items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+            indptr.append(len(indices))
+
+        return (np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int64),
+                np.asarray(counts, dtype=np.float64), vocabulary)
+
+    def relevance(self, articles: List[Article]) -> np.ndarray:
+        """Cosine similarity between each article's TF-IDF vector and the topic vector"""
+        indptr, indices, counts, vocabulary = self._term_matrix(articles)
+        n_docs = len(articles)
+        rows = np.repeat(np.arange(n_docs), np.diff(indptr))
+
+        # Smoothed IDF, as in scikit-learn's TfidfVectorizer
+        document_frequency = np.bincount(indices, minlength=len(vocabulary))
+        idf = np.log((1 + n_docs) / (1 + document_frequency)) + 1
+
+        weights = (1 + np.log(counts)) * idf[indices]  # Sublinear TF
+        norms = np.sqrt(np.bincount(rows, weights=weights ** 2, minlength=n_docs))
+
+        query = np.zeros(len(vocabulary))
+        topic_ids = [vocabulary[term] for term in TOPIC_TERMS if term in vocabulary]
+        if not topic_ids:
+            return np.zeros(n_docs)
+        query[topic_ids] = idf[topic_ids]
+        query /= np.linalg.norm(query)
+
+        dots = np.bincount(rows, weights=weights * query[indices], minlength=n_docs)
+        return np.divide(dots, norms, out=np.zeros(n_docs), where=norms > 0)
+
+    def recency(self, articles: List[Article], now: Optional[datetime] = None) -> np.ndarray:
+        """Exponential decay by article age with a PRERANK_HALF_LIFE_HOURS half-life"""
+        now = (now or datetime.now()).timestamp()
+        published = np.array([article.published_date.timestamp() for article in articles])
+        age_hours = np.maximum(0.0, (now - published) / 3600)
+        return np.exp2(-age_hours / self.config.PRERANK_HALF_LIFE_HOURS)
+
+    def priors(self, articles: List[Article]) -> np.ndarray:
+        return np.array([self.source_priors.get(article.source.lower(), 1.0) for article in articles])
+
+    def score(self, articles: List[Article], now: Optional[datetime] = None) -> np.ndarray:
+        """Pre-rank score for every article"""
+        if not articles:
+            return np.zeros(0)
+        return (self.relevance(articles) + BASE_RELEVANCE) * self.recency(articles, now) * self.priors(articles)
+
+    def shortlist(self, articles: List[Article], k: int, now: Optional[datetime] = None) -> List[Article]:
+        """The top `k` articles by pre-rank score, best first"""
+        if not articles:
+            return []
+
+        scores = self.score(articles, now)
+        k = max(1, min(k, len(articles)))  # A PRERANK_TOP_K of 0 or less still keeps the best article
+        # argpartition finds the top k without sorting everything; only those k get sorted
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.lexsort((top, -scores[top]))]  # Ties keep collection order
+
+        logger.info(
+            f"Pre-ranked {len(articles)} articles; shortlisted {k} "
+            f"(scores {scores[top[-1]]:.3f}-{scores[top[0]]:.3f})"
+        )
+        return [articles[i] for i in top]
@@ -0,0 +1,91 @@
+import re
+from typing import Dict, List, Set, Tuple
+from models import Article
+
+# Titles mentioning any of these are treated as AI/tech relevant ('*' marks a prefix)
+AI_KEYWORDS = ['ai', 'artificial intelligence', 'machine learning', 'neural', 'deep learning',
+               'chatgpt', 'gpt', 'llm*', 'openai', 'anthropic', 'google', 'meta', 'tech*',
+               'startup*', 'algorithm*', 'automation', 'robot*', 'quantum', 'cloud', 'data']
+
+# Below this many relevant articles, general articles are added as filler
+MIN_RELEVANT_ARTICLES = 10
+# Upper bound on candidates once filler articles are added
+MAX_CANDIDATES = 15
+
+
+class KeywordMatcher:
+    """Finds every keyword from several keyword classes in one pass of a single compiled regex
+
+    Keywords match whole words only, so 'ai' does not match inside 'said'. A trailing
+    '*' makes a keyword match as a word prefix, so 'robot*' also matches 'robotics'.
+    Overlapping keywords are all found ('google ai model' matches 'google ai' and
+    'ai model'); of keywords starting at the same word, only the longest counts.
+
+    The keywords are compiled as a character trie, so at each word start the regex
+    follows one branch instead of trying every keyword in turn. Each keyword ends
+    in an empty capture group, and the group that matched identifies the keyword.
+    """
+
+    def __init__(self, keyword_classes: Dict[str, List[str]]):
+        trie: dict = {}
+        for keyword_class, keywords in keyword_classes.items():
+            for keyword in keywords:
+                node = trie
+                for char in keyword.rstrip('*').lower():
+                    node = node.setdefault(char, {})
+                node[''] = (keyword_class, keyword)
+
+        self.keywords: List[Tuple[str, str]] = []  # (class, keyword) per capture group, in group order
+        # The lookahead lets matches overlap; the lookbehind restricts them to word starts
+        self.pattern = re.compile(r"(?<![a-z0-9])(?=" + self._trie_pattern(trie) + r"(?![a-z0-9]))")
+
+    def _trie_pattern(self, node: dict) -> str:
+        """Regex for a trie node, trying longer keywords before the one ending here"""
+        alternatives = [re.escape(char) + self._trie_pattern(child)
+                        for char, child in sorted(node.items()) if char]
+
+        if '' in node:
+            keyword_class, keyword = node['']
+            self.keywords.append((keyword_class, keyword))
+            alternatives.append("()" + (r"[a-z0-9]*" if keyword.endswith('*') else ""))
+
+        return alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+
+    def matches(self, text: str) -> Dict[str, Set[str]]:
+        """Map each keyword class found in `text` to the distinct keywords that matched"""
+        found: Dict[str, Set[str]] = {}
+        for match in self.pattern.finditer(text.lower()):
+            keyword_class, keyword = self.keywords[match.lastindex - 1]
+            found.setdefault(keyword_class, set()).add(keyword)
+        return found
+
+    def search(self, text: str) -> bool:
+        """Check whether `text` contains any keyword"""
+        return self.pattern.search(text.lower()) is not None
+
+
+RELEVANCE_MATCHER = KeywordMatcher({'ai': AI_KEYWORDS})
+
+
+def is_relevant(article: Article) -> bool:
+    """Check whether an article's title mentions an AI/tech keyword"""
+    return RELEVANCE_MATCHER.search(article.title)
+
+
+def select_candidates(articles: List[Article]) -> List[Article]:
+    """Pick the articles worth sending to the LLM for scoring and summarizing"""
+    # Filter to AI/tech relevant articles first by keywords in title
+    relevant_articles = [article for article in articles if is_relevant(article)]
+    
+    # If we don't have enough relevant articles, include some general tech articles
+    if len(relevant_articles) < MIN_RELEVANT_ARTICLES:
+        # URL-keyed membership keeps the top-up linear however many articles there are
+        selected_urls = {article.url for article in relevant_articles}
+        for article in articles:
+            if article.url not in selected_urls:
+                selected_urls.add(article.url)
+                relevant_articles.append(article)
+            if len(relevant_articles) >= MAX_CANDIDATES:
+                break
+    
+    return relevant_articles
@@ -0,0 +1,343 @@
+"""
+Local relevance model trained on the importance scores the LLM has assigned in past runs.
+
+Usage:
+  python relevance_model.py train       # fit on the score history, calibrate and save the model
+  python relevance_model.py evaluate    # check the saved model against clear cases the LLM audited since
+"""
+
+import re
+import sqlite3
+import sys
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from loguru import logger
+from config import Config
+from content_cache import canonical_url
+from models import Article
+
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Leading summary words used as features; titles are always used in full
+MAX_SUMMARY_WORDS = 300
+
+# Full-batch Adam on the logistic loss; the feature vectors are L2-normalized
+EPOCHS = 300
+LEARNING_RATE = 0.05
+L2_PENALTY = 1e-4
+
+# A confidence band needs at least this many held-out articles before it is trusted
+MIN_BAND_SIZE = 5
+
+
+class ScoreHistory:
+    """The LLM importance score of every article scored so far, one row per canonical URL"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the score history table if needed"""
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS llm_scores (
+                url TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                source TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                score REAL NOT NULL,
+                scored_at TEXT NOT NULL,
+                audit INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        # Histories recorded before audits existed lack the column
+        if 'audit' not in {row[1] for row in conn.execute('PRAGMA table_info(llm_scores)')}:
+            conn.execute('ALTER TABLE llm_scores ADD COLUMN audit INTEGER NOT NULL DEFAULT 0')
+        conn.commit()
+        conn.close()
+
+    def record(self, scored: List[Tuple[Article, float]], audited: Iterable[str] = ()):
+        """Store LLM scores; a rescored article keeps the time it was first scored
+
+        `audited` holds the URLs of clear cases the LLM scored only to check the model.
+        """
+        if not scored:
+            return
+
+        now = datetime.now().isoformat()
+        audited = {canonical_url(url) for url in audited}
+        rows = []
+        for article, score in scored:
+            url = canonical_url(article.url)
+            rows.append((url, article.title, article.source, article.summary, score, now, int(url in audited)))
+        try:
+            conn = self._connect()
+            conn.executemany(
+                '''
+                    INSERT INTO llm_scores (url, title, source, summary, score, scored_at, audit)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        title = excluded.title, source = excluded.source,
+                        summary = excluded.summary, score = excluded.score, audit = max(audit, excluded.audit)
+                ''',
+                rows
+            )
+            conn.commit()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error recording LLM scores: {e}")
+
+    def load(self, since: Optional[datetime] = None, audits_only: bool = False) -> Tuple[List[Article], np.ndarray]:
+        """Every article scored (since a given time, optionally only audits), with its score, oldest first"""
+        try:
+            conn = self._connect()
+            rows = conn.execute(
+                'SELECT url, title, source, summary, score, scored_at FROM llm_scores WHERE scored_at >= ? AND audit >= ? '
+                'ORDER BY scored_at, url',
+                (since.isoformat() if since else '', int(audits_only))
+            ).fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading LLM score history: {e}")
+            return [], np.zeros(0)
+
+        articles = [Article(title=title, url=url, summary=summary, source=source,
+                            published_date=datetime.fromisoformat(scored_at))
+                    for url, title, source, summary, _, scored_at in rows]
+        return articles, np.array([row[4] for row in rows], dtype=np.float64)
+
+
+class RelevanceModel:
+    """Logistic regression on hashed word n-grams, predicting whether the LLM would rate an article important
+
+    Title and summary unigrams and bigrams plus the source are hashed into
+    RELEVANCE_MODEL_FEATURES buckets. Training calibrates two probability
+    thresholds on held-out history: below `low` the LLM agreed the article was
+    minor, above `high` it agreed it was important, each at least
+    RELEVANCE_MODEL_CONFIDENCE of the time. Articles inside a band get that band's
+    typical LLM score; everything in between is left to the LLM.
+    """
+
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config()
+        self.dimensions = self.config.RELEVANCE_MODEL_FEATURES
+        self.weights = np.zeros(self.dimensions)
+        self.bias = 0.0
+        # An untrained model is never confident
+        self.low, self.high = -np.inf, np.inf
+        self.low_score, self.high_score = 1.0, 10.0
+        self.trained_at: Optional[datetime] = None
+
+    @staticmethod
+    def _terms(article: Article) -> List[str]:
+        title = WORD_PATTERN.findall(article.title.lower())
+        summary = WORD_PATTERN.findall(article.summary.lower())[:MAX_SUMMARY_WORDS]
+        terms = [f"source:{article.source.lower()}"]
+        for prefix, words in (('t', title), ('s', summary)):
+            terms.extend(f"{prefix}:{word}" for word in words)
+            terms.extend(f"{prefix}:{a} {b}" for a, b in zip(words, words[1:]))
+        return terms
+
+    def features(self, articles: List[Article]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Binary hashed features as a CSR matrix (indptr, indices, values), each row L2-normalized"""
+        indptr = [0]
+        indices: List[int] = []
+        for article in articles:
+            buckets = {zlib.crc32(term.encode('utf-8')) % self.dimensions for term in self._terms(article)}
+            indices.extend(buckets)
+            indptr.append(len(indices))
+
+        indptr = np.asarray(indptr, dtype=np.int64)
+        lengths = np.diff(indptr)
+        values = np.repeat(1 / np.sqrt(np.maximum(lengths, 1)), lengths)
+        return indptr, np.asarray(indices, dtype=np.int64), values
+
+    def _decision(self, matrix) -> np.ndarray:
+        indptr, indices, values = matrix
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        return np.bincount(rows, weights=self.weights[indices] * values, minlength=len(indptr) - 1) + self.bias
+
+    def predict_proba(self, articles: List[Article]) -> np.ndarray:
+        """Probability that the LLM would score each article as important"""
+        if not articles:
+            return np.zeros(0)
+        return 1 / (1 + np.exp(-self._decision(self.features(articles))))
+
+    def fit(self, articles: List[Article], labels: np.ndarray):
+        """Fit the weights, weighting both classes equally"""
+        matrix = self.features(articles)
+        indptr, indices, values = matrix
+        rows = np.repeat(np.arange(len(articles)), np.diff(indptr))
+        positives = labels.sum()
+        sample_weights = np.where(labels, 0.5 / max(positives, 1), 0.5 / max(len(labels) - positives, 1))
+
+        self.weights = np.zeros(self.dimensions)
+        self.bias = 0.0
+        moments = [np.zeros(self.dimensions + 1), np.zeros(self.dimensions + 1)]
+        beta1, beta2 = 0.9, 0.999
+
+        for step in range(1, EPOCHS + 1):
+            probabilities = 1 / (1 + np.exp(-self._decision(matrix)))
+            errors = (probabilities - labels) * sample_weights
+            gradient = np.append(
+                np.bincount(indices, weights=errors[rows] * values, minlength=self.dimensions) + L2_PENALTY * self.weights,
+                errors.sum()
+            )
+            moments[0] = beta1 * moments[0] + (1 - beta1) * gradient
+            moments[1] = beta2 * moments[1] + (1 - beta2) * gradient ** 2
+            update = LEARNING_RATE * (moments[0] / (1 - beta1 ** step)) / (np.sqrt(moments[1] / (1 - beta2 ** step)) + 1e-8)
+            self.weights -= update[:-1]
+            self.bias -= update[-1]
+
+    def calibrate(self, probabilities: np.ndarray, scores: np.ndarray):
+        """Pick the widest low and high bands where the LLM agreed often enough, from held-out predictions"""
+        confidence = self.config.RELEVANCE_MODEL_CONFIDENCE
+        labels = scores >= self.config.RELEVANCE_MODEL_POSITIVE_SCORE
+        self.low, self.high = -np.inf, np.inf
+
+        order = np.argsort(probabilities)
+        agreement = np.cumsum(~labels[order]) / np.arange(1, len(order) + 1)
+        trusted = np.flatnonzero(agreement[MIN_BAND_SIZE - 1:] >= confidence)
+        if len(trusted):
+            size = trusted[-1] + MIN_BAND_SIZE
+            self.low = float(probabilities[order[size - 1]])
+            self.low_score = float(np.median(scores[order[:size]]))
+
+        order = order[::-1]
+        agreement = np.cumsum(labels[order]) / np.arange(1, len(order) + 1)
+        trusted = np.flatnonzero(agreement[MIN_BAND_SIZE - 1:] >= confidence)
+        if len(trusted):
+            size = trusted[-1] + MIN_BAND_SIZE
+            self.high = max(float(probabilities[order[size - 1]]), np.nextafter(self.low, 1))
+            self.high_score = float(np.median(scores[order[:size]]))
+
+    def classify(self, articles: List[Article]) -> List[str]:
+        """'minor' or 'important' for each clear case, 'uncertain' for articles the LLM should score"""
+        return [
+            'minor' if p <= self.low else 'important' if p >= self.high else 'uncertain'
+            for p in self.predict_proba(articles)
+        ]
+
+    def evaluate(self, articles: List[Article], scores: np.ndarray) -> Dict[str, float]:
+        """How many articles the model decides locally, and how often the LLM agreed with those decisions"""
+        probabilities = self.predict_proba(articles)
+        labels = scores >= self.config.RELEVANCE_MODEL_POSITIVE_SCORE
+        minor = probabilities <= self.low
+        important = probabilities >= self.high
+        decided = minor | important
+        correct = (minor & ~labels) | (important & labels)
+
+        return {
+            'articles': len(articles),
+            'accuracy': float(np.mean((probabilities >= 0.5) == labels)) if len(articles) else 0.0,
+            'minor': int(minor.sum()),
+            'important': int(important.sum()),
+            'decided': float(decided.mean()) if len(articles) else 0.0,
+            'agreement': float(correct.sum() / decided.sum()) if decided.any() else 0.0,
+            'score_error': float(np.mean(np.abs(np.where(minor, self.low_score, self.high_score) - scores)[decided]))
+            if decided.any() else 0.0
+        }
+
+    def save(self, path: str):
+        """Write the weights and calibrated bands to an .npz file"""
+        np.savez_compressed(
+            path,
+            weights=self.weights,
+            bias=self.bias,
+            bands=np.array([self.low, self.high, self.low_score, self.high_score]),
+            trained_at=(self.trained_at or datetime.now()).isoformat()
+        )
+
+    @classmethod
+    def load(cls, path: str, config: Optional[Config] = None) -> Optional["RelevanceModel"]:
+        """A model saved by `save`, or None if there is no usable one at `path`"""
+        try:
+            with np.load(path) as saved:
+                model = cls(config)
+                if len(saved['weights']) != model.dimensions:
+                    logger.warning(f"Relevance model at {path} was trained with different RELEVANCE_MODEL_FEATURES; retrain it")
+                    return None
+                model.weights = saved['weights']
+                model.bias = float(saved['bias'])
+                model.low, model.high, model.low_score, model.high_score = (float(value) for value in saved['bands'])
+                model.trained_at = datetime.fromisoformat(str(saved['trained_at']))
+                return model
+        except FileNotFoundError:
+            logger.warning(f"No relevance model at {path}; run `python relevance_model.py train`")
+        except Exception as e:
+            logger.error(f"Error loading relevance model from {path}: {e}")
+        return None
+
+
+def log_evaluation(label: str, report: Dict[str, float]):
+    logger.info(
+        f"{label}: {report['articles']} articles, accuracy {report['accuracy']:.1%}, "
+        f"{report['decided']:.0%} decided locally ({report['minor']} minor, {report['important']} important) "
+        f"with {report['agreement']:.1%} LLM agreement, mean score error {report['score_error']:.2f}"
+    )
+
+
+def train(config: Config) -> Optional[RelevanceModel]:
+    """Fit on the older 80% of the history and calibrate the confidence bands on the newest 20%"""
+    articles, scores = ScoreHistory(config.CONTENT_CACHE_DB).load()
+    labels = scores >= config.RELEVANCE_MODEL_POSITIVE_SCORE
+    if len(articles) < config.RELEVANCE_MODEL_MIN_HISTORY or labels.all() or not labels.any():
+        logger.error(
+            f"Need at least {config.RELEVANCE_MODEL_MIN_HISTORY} LLM-scored articles with both minor and important "
+            f"ones to train; have {len(articles)} ({int(labels.sum())} important)"
+        )
+        return None
+
+    split = int(len(articles) * 0.8)
+    model = RelevanceModel(config)
+    model.fit(articles[:split], labels[:split])
+    model.calibrate(model.predict_proba(articles[split:]), scores[split:])
+    log_evaluation("Held-out history", model.evaluate(articles[split:], scores[split:]))
+
+    # Saved without refitting on the held-out 20%, since the bands only hold for these weights
+    model.trained_at = datetime.now()
+    model.save(config.RELEVANCE_MODEL_PATH)
+    logger.info(
+        f"Saved relevance model to {config.RELEVANCE_MODEL_PATH}: minor below p={model.low:.3f} "
+        f"(score {model.low_score:g}), important above p={model.high:.3f} (score {model.high_score:g})"
+    )
+    return model
+
+
+def evaluate(config: Config):
+    """Report how the saved model does on the clear cases audited by the LLM since it was trained
+
+    Other articles scored since then are the ones the model left to the LLM, so they say
+    nothing about its local decisions.
+    """
+    model = RelevanceModel.load(config.RELEVANCE_MODEL_PATH, config)
+    if model is None:
+        return
+    articles, scores = ScoreHistory(config.CONTENT_CACHE_DB).load(since=model.trained_at, audits_only=True)
+    if not articles:
+        logger.error(
+            f"No clear cases audited by the LLM since the model was trained at {model.trained_at:%Y-%m-%d %H:%M}; "
+            f"check RELEVANCE_MODEL_AUDIT_RATE"
+        )
+        return
+    log_evaluation(f"Audited since {model.trained_at:%Y-%m-%d %H:%M}", model.evaluate(articles, scores))
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'evaluate'
+    if command == 'train':
+        train(Config())
+    elif command == 'evaluate':
+        evaluate(Config())
+    else:
+        print(__doc__)
+
+
+if __name__ == "__main__":
+    main()